@@ -3,7 +3,8 @@
 """
 WNAP EXE 빌드 스크립트
 
-PyInstaller를 사용하여 WNAP를 단일 실행 파일로 패키징합니다.
+PyInstaller를 사용하여 WNAP를 실행 폴더(onedir)로 패키징합니다.
+(onefile은 실행할 때마다 임시 폴더에 전체를 압축 해제하므로 시작이 느림)
 
 사용법:
     python build_exe.py
@@ -72,7 +73,7 @@ def clean_build_folders():
 
 def build_exe(debug: bool = False):
     """
-    PyInstaller로 EXE 빌드 (onefile 모드)
+    PyInstaller로 EXE 빌드 (onedir 모드)
     """
     print("=" * 60)
     print(f"🔨 WNAP EXE 빌드 시작 - v{__version__}")
@@ -89,7 +90,7 @@ def build_exe(debug: bool = False):
     cmd = [
         sys.executable, '-m', 'PyInstaller',
         '--name', exe_name,
-        '--onefile',  # 단일 파일 모드
+        '--onedir',   # 폴더 모드 (실행 시 압축 해제 없음)
         '--clean',    # 캐시 정리
         # CustomTkinter 전체 수집 (테마 포함)
         '--collect-all', 'customtkinter',
@@ -108,6 +109,9 @@ def build_exe(debug: bool = False):
         '--hidden-import', 'core.utils.similarity',
         '--hidden-import', 'PIL._tkinter_finder',
         '--hidden-import', 'dotenv',
+        # 테스트 코드는 번들에서 제외
+        '--exclude-module', 'tests',
+        '--exclude-module', 'pytest',
     ]
 
     # 디버그 모드가 아니면 콘솔 숨김
@@ -139,13 +143,13 @@ def build_exe(debug: bool = False):
     print("=" * 60)
 
     # 결과 확인
-    dist_folder = Path('dist')
+    dist_folder = Path('dist') / exe_name
     exe_path = dist_folder / f"{exe_name}.exe"
 
     if exe_path.exists():
         size_mb = exe_path.stat().st_size / (1024 * 1024)
         print(f"📁 EXE 위치: {exe_path.absolute()}")
-        print(f"📏 파일 크기: {size_mb:.1f} MB")
+        print(f"📏 EXE 크기: {size_mb:.1f} MB")
         print(f"📌 버전: {get_full_version()}")
 
         # 후처리: .env 파일 복사 (실행 위치로)
@@ -197,8 +201,8 @@ def main():
         print("=" * 60)
         print()
         print("배포 시 포함할 파일:")
-        print(f"  - dist/WNAP_Manager_v{__version__}.exe")
-        print("  - dist/config/ (선택 - 사용자 설정)")
+        print(f"  - dist/WNAP_Manager_v{__version__}/ (폴더 전체)")
+        print("  (폴더 전체를 zip 등으로 묶어 배포)")
         print()
 
     return 0 if success else 1
@@ -1,9 +1,20 @@
 # Core Package
-from core.novel_task import NovelTask
-from core.pipeline_orchestrator import PipelineOrchestrator, PipelineResult
-from core.pipeline_logger import PipelineLogger
-from core.title_anchor_extractor import TitleAnchorExtractor
-from core.path_utils import get_base_path, get_config_path, get_resource_path
+#
+# 하위 모듈은 실제로 접근할 때 로드합니다 (PEP 562).
+# `from core.version import ...`처럼 가벼운 모듈만 필요한 경우
+# 파이프라인 전체(어댑터, 분류기 등)를 불러오지 않기 위함입니다.
+import importlib
+
+_LAZY_EXPORTS = {
+    'NovelTask': 'core.novel_task',
+    'PipelineOrchestrator': 'core.pipeline_orchestrator',
+    'PipelineResult': 'core.pipeline_orchestrator',
+    'PipelineLogger': 'core.pipeline_logger',
+    'TitleAnchorExtractor': 'core.title_anchor_extractor',
+    'get_base_path': 'core.path_utils',
+    'get_config_path': 'core.path_utils',
+    'get_resource_path': 'core.path_utils',
+}
 
 __all__ = [
     'NovelTask',
@@ -15,3 +26,16 @@ __all__ = [
     'get_config_path',
     'get_resource_path'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
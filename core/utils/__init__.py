@@ -5,9 +5,11 @@ Core utilities for the WNAP pipeline.
 from core.utils.similarity import TitleSimilarityChecker
 from core.utils.genre_mapping import GenreMappingLoader
 from core.utils.genre_cache import GenreCache
+from core.utils.env import ensure_env_loaded
 
 __all__ = [
     'TitleSimilarityChecker',
     'GenreMappingLoader',
     'GenreCache',
+    'ensure_env_loaded',
 ]
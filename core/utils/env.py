@@ -0,0 +1,14 @@
+"""
+.env 환경 변수 로더
+
+.env 파일 탐색/파싱은 프로세스당 한 번만 수행합니다.
+API 키가 실제로 필요한 시점(설정 로드, GUI 시작 등)에 호출하세요.
+"""
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_env_loaded() -> None:
+    """.env 파일을 환경 변수로 로드 (시스템 변수보다 우선, 최초 호출 시 1회)"""
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
@@ -36,6 +36,7 @@ from core.pipeline_orchestrator import PipelineOrchestrator, PipelineResult
 from core.pipeline_logger import PipelineLogger
 from core.novel_task import NovelTask
 from core.path_utils import get_config_path
+from core.utils.env import ensure_env_loaded
 from core.version import __version__, get_full_version
 from gui.genre_confirm_dialog import show_genre_confirm_dialog
 from gui.utils.state_manager import WindowStateManager
@@ -128,6 +129,24 @@ TOOLTIP_TEXTS = {
 }
 
 
+def swap_genre_tag(normalized: str, old_genre: str, new_genre: str) -> str:
+    """정규화된 파일명의 장르 태그를 교체 (앞뒤 공백 없는 결과 반환)
+
+    장르 태그는 맨 앞에 위치하므로 접두사만 교체하고 (제목 내 동일 문자열 보호),
+    기존 태그가 없으면 새 태그를 맨 앞에 추가합니다.
+    """
+    old_genre_tag = f"[{old_genre}]" if old_genre else ""
+    new_genre_tag = f"[{new_genre}]" if new_genre else ""
+    if old_genre_tag and normalized.startswith(old_genre_tag):
+        rest = normalized[len(old_genre_tag):]
+    elif old_genre_tag and old_genre_tag in normalized:
+        return normalized.replace(old_genre_tag, new_genre_tag, 1).strip()
+    else:
+        rest = normalized
+    # 태그만 있는 이름이나 빈 태그에도 공백이 남지 않도록 빈 조각은 제외하고 결합
+    return " ".join(filter(None, (new_genre_tag, rest.strip())))
+
+
 class EditNameDialog(ctk.CTkToplevel):
     """파일명/장르 편집 다이얼로그 (초기값 지원)"""
     def __init__(self, parent, title: str, initial_value: str = ""):
@@ -201,6 +220,9 @@ class WNAPMainWindow(ctk.CTk):
     """WNAP 메인 윈도우 - 프로페셔널 에디션 v2"""
     
     def __init__(self, log_level: str = "INFO"):
+        # 환경 변수 로드 (API 키 등, 프로세스당 1회)
+        ensure_env_loaded()
+        
         super().__init__()
         
         # 윈도우 설정
@@ -1603,23 +1625,13 @@ class WNAPMainWindow(ctk.CTk):
                     task_idx = int(item)
                     if 0 <= task_idx < len(self.tasks_cache):
                         task = self.tasks_cache[task_idx]
-                        old_genre_tag = f"[{current_genre}]" if current_genre else ""
-                        new_genre_tag = f"[{new_genre}]" if new_genre else ""
                         
                         # 1. 태스크 장르 업데이트
                         task.genre = new_genre
                         task.metadata['genre'] = new_genre
                         
                         # 2. 정규화된 파일명 업데이트 (장르 태그 교체)
-                        new_normalized = current_normalized
-                        if old_genre_tag and old_genre_tag in current_normalized:
-                             new_normalized = current_normalized.replace(old_genre_tag, new_genre_tag, 1)
-                        elif new_genre_tag:
-                             # 기존 장르가 없었다면 맨 앞에 추가
-                             new_normalized = f"{new_genre_tag} {current_normalized}"
-                        
-                        # 공백 정리 (혹시 모를 이중 공백)
-                        new_normalized = new_normalized.strip()
+                        new_normalized = swap_genre_tag(current_normalized, current_genre, new_genre)
                         task.metadata['normalized_name'] = new_normalized
                         task.metadata['user_edited'] = True  # 수동 편집 플래그
                         
@@ -8,12 +8,30 @@ config/gui_state.json 파일을 사용하여 상태를 유지합니다.
 
 Validates: Requirements 7.1, 7.2, 7.3, 7.4, 7.5
 """
+import atexit
 import json
+import os
+import queue
+import re
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import customtkinter as ctk
 
 
+# Windows에서 os.open()이 텍스트 모드로 열리지 않도록
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+# Tk geometry 문자열 ("WxH+X+Y") 파서
+_GEOMETRY_RE = re.compile(r'^(\d+)x(\d+)\+?(-?\d+)\+?(-?\d+)$')
+
+# 비동기 저장 큐 (단일 슬롯: 가장 최근 상태만 유지)
+_save_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1)
+_save_thread: Optional[threading.Thread] = None
+_save_thread_lock = threading.Lock()
+_write_lock = threading.Lock()
+
+
 class WindowStateManager:
     """윈도우 상태 저장/복원 관리자"""
     
@@ -22,6 +40,16 @@ class WindowStateManager:
     DEFAULT_HEIGHT = 1000
     MIN_VISIBLE_PIXELS = 100  # 최소 화면에 보여야 하는 픽셀
     
+    _READ_LIMIT = 65536  # 상태 파일 최대 읽기 크기 (bytes)
+    
+    # load_state 캐시 (파일 mtime이 같으면 디스크를 다시 읽지 않음)
+    _cached_state: Optional[Dict[str, Any]] = None
+    _cache_mtime: float = 0.0
+    
+    # 화면 크기 캐시 (Tcl 왕복 호출 절감, 윈도우 <Configure> 시 무효화)
+    _screen_cache: Optional[Tuple[int, int]] = None
+    _screen_bound_windows: "set[str]" = set()
+    
     @classmethod
     def load_state(cls) -> Dict[str, Any]:
         """
@@ -31,13 +59,27 @@ class WindowStateManager:
             dict: 저장된 상태 또는 빈 딕셔너리
         """
         try:
-            if cls.STATE_FILE.exists():
-                with open(cls.STATE_FILE, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                    # 위치 키만 검증 (크기는 저장하지 않음)
-                    if all(key in state for key in ['x', 'y']):
-                        return state
-        except (json.JSONDecodeError, IOError, KeyError):
+            mtime = os.stat(cls.STATE_FILE).st_mtime
+        except OSError:
+            # 첫 실행 등 상태 파일이 없는 경우 (기록 대기 중인 캐시는 반환)
+            return dict(cls._cached_state) if cls._cached_state is not None else {}
+        
+        if cls._cached_state is not None and mtime == cls._cache_mtime:
+            return dict(cls._cached_state)
+        
+        try:
+            fd = os.open(str(cls.STATE_FILE), os.O_RDONLY | _O_BINARY)
+            try:
+                data = os.read(fd, cls._READ_LIMIT)
+            finally:
+                os.close(fd)
+            state = json.loads(data)
+            # 위치 키만 검증 (크기는 저장하지 않음)
+            if all(key in state for key in ['x', 'y']):
+                cls._cached_state = dict(state)
+                cls._cache_mtime = mtime
+                return state
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError, KeyError):
             pass
         return {}
     
@@ -46,27 +88,78 @@ class WindowStateManager:
         """
         현재 윈도우 위치만 저장 (크기는 저장하지 않음)
         
+        위치 값은 호출 스레드(Tk 메인 루프)에서 읽고, 실제 파일 기록은
+        백그라운드 스레드에서 수행하여 UI가 디스크 I/O에 막히지 않습니다.
+        
         Args:
             window: CTk 윈도우 인스턴스
             
         Returns:
-            bool: 저장 성공 여부
+            bool: 저장 요청 성공 여부
         """
         try:
-            cls.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            
             # 위치만 저장 (크기는 항상 기본값 사용)
             state = {
                 "x": window.winfo_x(),
                 "y": window.winfo_y()
             }
-            
-            with open(cls.STATE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
-            
-            return True
-        except (IOError, OSError):
+        except Exception:
             return False
+        
+        # 기록 전이라도 load_state가 최신 상태를 반환하도록 캐시 먼저 갱신
+        cls._cached_state = dict(state)
+        
+        _ensure_save_thread()
+        try:
+            _save_queue.put_nowait(state)
+        except queue.Full:
+            # 대기 중인 이전 상태는 버리고 최신 상태로 교체
+            try:
+                _save_queue.get_nowait()
+                _save_queue.task_done()
+            except queue.Empty:
+                pass
+            try:
+                _save_queue.put_nowait(state)
+            except queue.Full:
+                return False
+        
+        return True
+    
+    @classmethod
+    def _write_state(cls, state: Dict[str, Any]) -> bool:
+        """
+        상태를 임시 파일에 기록한 뒤 os.replace로 원자적으로 교체
+        
+        Args:
+            state: 저장할 상태 딕셔너리
+            
+        Returns:
+            bool: 기록 성공 여부
+        """
+        with _write_lock:
+            tmp_path = cls.STATE_FILE.with_name(cls.STATE_FILE.name + '.tmp')
+            try:
+                cls.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                
+                # 위치 2개뿐인 작은 파일이므로 들여쓰기 없이 한 번에 직렬화/기록
+                payload = json.dumps(state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                fd = os.open(
+                    str(tmp_path),
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY
+                )
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, cls.STATE_FILE)
+                
+                # 방금 기록한 상태로 캐시 갱신
+                cls._cached_state = dict(state)
+                cls._cache_mtime = os.stat(cls.STATE_FILE).st_mtime
+                return True
+            except (IOError, OSError):
+                return False
     
     @classmethod
     def restore_state(cls, window: ctk.CTk) -> bool:
@@ -80,8 +173,7 @@ class WindowStateManager:
             bool: 복원 성공 여부 (기본값 사용 시 False)
         """
         # 화면 크기 가져오기
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = cls._get_screen_size(window)
         
         # 기본 크기 설정 (화면 크기 초과 방지)
         width = min(cls.DEFAULT_WIDTH, screen_width - 100)
@@ -90,9 +182,10 @@ class WindowStateManager:
         state = cls.load_state()
         
         if not state:
-            # 기본 크기로 중앙 배치
-            window.geometry(f"{width}x{height}")
-            cls._center_window(window)
+            # 기본 크기로 중앙 배치 (크기+위치를 한 번의 geometry 호출로 적용)
+            x = (screen_width - width) // 2
+            y = (screen_height - height) // 2
+            cls._apply_geometry(window, width, height, x, y)
             return False
         
         # 저장된 위치 가져오기
@@ -102,9 +195,49 @@ class WindowStateManager:
         # 위치 검증 및 보정
         x, y = cls._validate_position(x, y, width, height, screen_width, screen_height)
         
-        window.geometry(f"{width}x{height}+{x}+{y}")
+        cls._apply_geometry(window, width, height, x, y)
         return True
     
+    @classmethod
+    def _apply_geometry(cls, window: ctk.CTk, width: int, height: int, x: int, y: int):
+        """현재 geometry와 다를 때만 적용 (불필요한 WM configure/redraw 방지)"""
+        match = _GEOMETRY_RE.match(window.geometry())
+        if match and tuple(int(v) for v in match.groups()) == (width, height, x, y):
+            return
+        window.geometry(f"{width}x{height}+{x}+{y}")
+    
+    @classmethod
+    def _get_screen_size(cls, window: ctk.CTk) -> Tuple[int, int]:
+        """
+        화면 크기 반환 (최초 1회 조회 후 캐시)
+        
+        윈도우가 이동/리사이즈되면(<Configure>) 캐시를 비워
+        다른 모니터로 옮겨진 경우 다음 조회 때 다시 읽습니다.
+        """
+        if cls._screen_cache is None:
+            cls._screen_cache = (window.winfo_screenwidth(), window.winfo_screenheight())
+            
+            window_id = str(window)
+            if window_id not in cls._screen_bound_windows:
+                window.bind("<Configure>", cls._invalidate_screen_cache, add="+")
+                cls._screen_bound_windows.add(window_id)
+        
+        return cls._screen_cache
+    
+    @classmethod
+    def _invalidate_screen_cache(cls, event=None):
+        """
+        화면 크기 캐시 무효화
+        
+        최상위 윈도우의 <Configure> 바인딩은 bindtag를 통해 모든 자식 위젯의
+        <Configure>에서도 호출되므로, 윈도우 자체의 이벤트일 때만 비웁니다.
+        """
+        if event is not None:
+            widget = event.widget
+            if isinstance(widget, str) or widget is not widget.winfo_toplevel():
+                return
+        cls._screen_cache = None
+    
     @classmethod
     def _validate_position(
         cls, x: int, y: int, width: int, height: int,
@@ -149,8 +282,7 @@ class WindowStateManager:
         """윈도우를 화면 중앙에 배치"""
         window.update_idletasks()
         
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = cls._get_screen_size(window)
         window_width = window.winfo_width()
         window_height = window.winfo_height()
         
@@ -177,3 +309,43 @@ class WindowStateManager:
             y >= 0 and
             y <= screen_height - cls.MIN_VISIBLE_PIXELS
         )
+
+
+def _save_worker():
+    """저장 큐를 소비하는 백그라운드 스레드 본체"""
+    while True:
+        state = _save_queue.get()
+        try:
+            WindowStateManager._write_state(state)
+        finally:
+            _save_queue.task_done()
+
+
+def _ensure_save_thread():
+    """저장 스레드를 최초 호출 시 지연 시작"""
+    global _save_thread
+    with _save_thread_lock:
+        if _save_thread is not None and _save_thread.is_alive():
+            return
+        _save_thread = threading.Thread(
+            target=_save_worker,
+            name="WindowStateSaver",
+            daemon=True
+        )
+        _save_thread.start()
+
+
+@atexit.register
+def _flush_pending_save():
+    """프로세스 종료 시 아직 기록되지 않은 마지막 상태까지 기록 완료"""
+    if _save_thread is not None and _save_thread.is_alive():
+        # 저장 스레드가 대기 중인 항목까지 순서대로 처리하도록 대기
+        _save_queue.join()
+        return
+    
+    try:
+        state = _save_queue.get_nowait()
+    except queue.Empty:
+        return
+    WindowStateManager._write_state(state)
+    _save_queue.task_done()
@@ -9,6 +9,7 @@ Tooltip Manager
 Validates: Requirements 6.2, 6.3, 6.5
 """
 import tkinter as tk
+import weakref
 from typing import Optional
 
 
@@ -20,10 +21,92 @@ TOOLTIP_FONT = ("Segoe UI", 11)
 TOOLTIP_DELAY = 500  # ms
 TOOLTIP_WRAP_LENGTH = 300
 
+# 툴팁 이벤트용 공유 bindtag (Tk 루트마다 bind_class 1회만 등록)
+_TOOLTIP_TAG = "WNAPTooltip"
+_registered_roots: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
+# Tk 루트별 화면 크기 캐시 (호버마다 Tcl 왕복 방지, 루트 <Configure> 시 무효화)
+_screen_sizes: "weakref.WeakKeyDictionary[tk.Misc, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _find_tooltip(widget) -> Optional["TooltipManager"]:
+    """이벤트 위젯(또는 그 상위 위젯)에 연결된 TooltipManager 조회"""
+    while widget is not None and not isinstance(widget, str):
+        tooltip = getattr(widget, "_tooltip", None)
+        if tooltip is not None:
+            return tooltip
+        widget = getattr(widget, "master", None)
+    return None
+
+
+def _dispatch_enter(event):
+    tooltip = _find_tooltip(event.widget)
+    if tooltip is not None:
+        tooltip._schedule_show(event)
+
+
+def _dispatch_leave(event):
+    tooltip = _find_tooltip(event.widget)
+    if tooltip is not None:
+        tooltip._hide(event)
+
+
+def _get_screen_size(widget) -> tuple:
+    """위젯이 속한 루트의 화면 크기 (캐시)"""
+    root = widget._root()
+    size = _screen_sizes.get(root)
+    if size is None:
+        size = (root.winfo_screenwidth(), root.winfo_screenheight())
+        _screen_sizes[root] = size
+    return size
+
+
+def _invalidate_screen_size(event):
+    """
+    화면 크기 캐시 무효화
+
+    윈도우가 이동/리사이즈되면(다른 해상도의 모니터로 이동 포함) 다음 툴팁 표시 때 다시 조회합니다.
+    루트의 <Configure> 바인딩은 bindtag를 통해 모든 자식 위젯에서도 호출되므로 루트 자체의 이벤트만 처리합니다.
+    """
+    widget = event.widget
+    if widget is None or isinstance(widget, str) or widget is not widget._root():
+        return
+    _screen_sizes.pop(widget, None)
+
+
+def _register_tooltip_class(widget):
+    """공유 bindtag에 이벤트 핸들러 등록 (루트당 1회)"""
+    root = widget._root()
+    if root in _registered_roots:
+        return
+    root.bind_class(_TOOLTIP_TAG, "<Enter>", _dispatch_enter)
+    root.bind_class(_TOOLTIP_TAG, "<Leave>", _dispatch_leave)
+    root.bind_class(_TOOLTIP_TAG, "<ButtonPress>", _dispatch_leave)
+    root.bind("<Configure>", _invalidate_screen_size, add="+")
+    _registered_roots.add(root)
+
+
+def _iter_bind_targets(widget):
+    """
+    bindtag를 추가할 위젯 목록
+
+    CustomTkinter 위젯은 내부 canvas/label 자식 위젯으로 이벤트를 받으므로
+    하위 위젯까지 함께 포함합니다.
+    """
+    yield widget
+    for child in widget.winfo_children():
+        yield from _iter_bind_targets(child)
+
 
 class TooltipManager:
     """비차단 툴팁 관리자"""
     
+    # 모든 인스턴스가 재사용하는 공유 툴팁 윈도우 (최초 표시 시 생성)
+    _shared_window: Optional[tk.Toplevel] = None
+    _shared_frame: Optional[tk.Frame] = None
+    _shared_label: Optional[tk.Label] = None
+    # 현재 공유 윈도우를 사용 중인 인스턴스
+    _current_owner: Optional["weakref.ReferenceType[TooltipManager]"] = None
+    
     def __init__(
         self,
         widget,
@@ -47,10 +130,13 @@ class TooltipManager:
         self.tooltip_window: Optional[tk.Toplevel] = None
         self.scheduled_id: Optional[str] = None
         
-        # 이벤트 바인딩
-        widget.bind("<Enter>", self._schedule_show, add="+")
-        widget.bind("<Leave>", self._hide, add="+")
-        widget.bind("<ButtonPress>", self._hide, add="+")
+        # 이벤트 바인딩 (공유 bindtag 추가만 수행)
+        _register_tooltip_class(widget)
+        widget._tooltip = self
+        for target in _iter_bind_targets(widget):
+            tags = target.bindtags()
+            if _TOOLTIP_TAG not in tags:
+                target.bindtags(tags + (_TOOLTIP_TAG,))
     
     def _schedule_show(self, event=None):
         """지연 후 툴팁 표시 예약"""
@@ -63,29 +149,28 @@ class TooltipManager:
             self.widget.after_cancel(self.scheduled_id)
             self.scheduled_id = None
     
-    def _show(self):
-        """툴팁 표시"""
-        if self.tooltip_window:
-            return
-        
-        # 위젯 위치 계산
-        try:
-            x = self.widget.winfo_rootx() + 20
-            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        except tk.TclError:
-            return
+    @classmethod
+    def _get_shared_window(cls, widget) -> tk.Toplevel:
+        """공유 툴팁 윈도우 반환 (없거나 파괴된 경우 새로 생성)"""
+        window = cls._shared_window
+        if window is not None:
+            try:
+                if window.winfo_exists():
+                    return window
+            except tk.TclError:
+                pass
         
-        # 툴팁 윈도우 생성
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        # 툴팁 윈도우 생성 (숨김 상태로 시작)
+        window = tk.Toplevel(widget.winfo_toplevel())
+        window.withdraw()
+        window.wm_overrideredirect(True)
         
         # 툴팁이 항상 최상위에 표시되도록
-        self.tooltip_window.wm_attributes("-topmost", True)
+        window.wm_attributes("-topmost", True)
         
         # 프레임 (테두리 효과)
         frame = tk.Frame(
-            self.tooltip_window,
+            window,
             background=TOOLTIP_BG,
             borderwidth=1,
             relief="solid",
@@ -97,17 +182,52 @@ class TooltipManager:
         # 텍스트 레이블
         label = tk.Label(
             frame,
-            text=self.text,
             background=TOOLTIP_BG,
             foreground=TOOLTIP_FG,
             font=TOOLTIP_FONT,
             padx=10,
             pady=6,
-            wraplength=self.wrap_length,
             justify="left"
         )
         label.pack()
         
+        cls._shared_window = window
+        cls._shared_frame = frame
+        cls._shared_label = label
+        cls._current_owner = None
+        return window
+    
+    def _show(self):
+        """툴팁 표시"""
+        if self.tooltip_window:
+            return
+        
+        # 위젯 위치 계산
+        try:
+            x = self.widget.winfo_rootx() + 20
+            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+        except tk.TclError:
+            return
+        
+        # 다른 인스턴스가 공유 윈도우를 사용 중이면 먼저 숨김
+        owner = TooltipManager._current_owner() if TooltipManager._current_owner else None
+        if owner is not None and owner is not self:
+            owner._hide()
+        
+        try:
+            window = self._get_shared_window(self.widget)
+            TooltipManager._shared_label.configure(
+                text=self.text,
+                wraplength=self.wrap_length
+            )
+            window.wm_geometry(f"+{x}+{y}")
+            window.deiconify()
+        except tk.TclError:
+            return
+        
+        self.tooltip_window = window
+        TooltipManager._current_owner = weakref.ref(self)
+        
         # 화면 범위 체크 및 위치 조정
         self._adjust_position()
     
@@ -125,9 +245,8 @@ class TooltipManager:
             tooltip_x = self.tooltip_window.winfo_x()
             tooltip_y = self.tooltip_window.winfo_y()
             
-            # 화면 크기
-            screen_width = self.tooltip_window.winfo_screenwidth()
-            screen_height = self.tooltip_window.winfo_screenheight()
+            # 화면 크기 (루트별 캐시, 윈도우 이동 시 갱신)
+            screen_width, screen_height = _get_screen_size(self.widget)
             
             # X 위치 조정
             if tooltip_x + tooltip_width > screen_width:
@@ -145,10 +264,14 @@ class TooltipManager:
         """툴팁 숨기기"""
         self._cancel_scheduled()
         if self.tooltip_window:
-            try:
-                self.tooltip_window.destroy()
-            except tk.TclError:
-                pass
+            # 공유 윈도우는 파괴하지 않고 숨기기만 함 (다음 표시 때 재사용)
+            owner = TooltipManager._current_owner() if TooltipManager._current_owner else None
+            if owner is self:
+                try:
+                    self.tooltip_window.withdraw()
+                except tk.TclError:
+                    pass
+                TooltipManager._current_owner = None
             self.tooltip_window = None
     
     def update_text(self, new_text: str):
@@ -163,11 +286,14 @@ class TooltipManager:
         """툴팁 매니저 정리"""
         self._hide()
         try:
-            self.widget.unbind("<Enter>")
-            self.widget.unbind("<Leave>")
-            self.widget.unbind("<ButtonPress>")
+            for target in _iter_bind_targets(self.widget):
+                tags = target.bindtags()
+                if _TOOLTIP_TAG in tags:
+                    target.bindtags(tuple(tag for tag in tags if tag != _TOOLTIP_TAG))
         except tk.TclError:
             pass
+        if getattr(self.widget, "_tooltip", None) is self:
+            del self.widget._tooltip
 
 
 def create_tooltip(widget, text: str, delay: int = TOOLTIP_DELAY) -> TooltipManager:
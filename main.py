@@ -17,18 +17,12 @@ Validates: Requirements 8.1, 8.2
 """
 import sys
 import os
-from dotenv import load_dotenv
+import stat
 
-# 환경 변수 로드 (API 키 등)
-load_dotenv(override=True)
-
-# 프로젝트 루트를 sys.path에 추가 (절대 import 지원)
 _project_root = os.path.dirname(os.path.abspath(__file__))
-if _project_root not in sys.path:
-    sys.path.insert(0, _project_root)
 
 # ============================================================================
-# PyInstaller 경로 보정 (EXE 실행 환경 지원)
+# 경로 보정 (절대 import 지원 + PyInstaller EXE 실행 환경)
 # ============================================================================
 def _setup_paths():
     if getattr(sys, 'frozen', False):
@@ -60,18 +54,30 @@ def run_gui(log_level: str = 'INFO'):
 # ============================================================================
 # CLI 모드
 # ============================================================================
-import argparse
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from core.version import __version__, get_full_version
-from core.pipeline_orchestrator import PipelineOrchestrator, PipelineResult
-from core.pipeline_logger import PipelineLogger
-from config.pipeline_config import PipelineConfig
 
+if TYPE_CHECKING:
+    # argparse는 CLI 인자가 있을 때만, 파이프라인 모듈은 실제 실행 시점(run_pipeline)에 로드
+    import argparse
+    from core.novel_task import NovelTask
+    from core.pipeline_orchestrator import PipelineResult
+
+
+_PARSER: Optional['argparse.ArgumentParser'] = None
+
+
+def create_parser() -> 'argparse.ArgumentParser':
+    """CLI 인자 파서 생성 (최초 1회만 생성 후 재사용)"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
+    import argparse
 
-def create_parser() -> argparse.ArgumentParser:
-    """CLI 인자 파서 생성"""
     parser = argparse.ArgumentParser(
         prog='wnap',
         description=f'Web Novel Archive Pipeline v{__version__} - 웹소설 아카이브 자동 정리 도구',
@@ -149,14 +155,18 @@ def create_parser() -> argparse.ArgumentParser:
         help='버전 정보 출력'
     )
 
+    _PARSER = parser
     return parser
 
 
 def validate_source_folder(source_path: Path) -> bool:
-    if not source_path.exists():
+    # stat 한 번으로 존재 여부와 폴더 여부를 함께 확인
+    try:
+        st = os.stat(source_path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"\n❌ 오류: 소스 폴더가 존재하지 않습니다: {source_path}")
         return False
-    if not source_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         print(f"\n❌ 오류: 지정된 경로가 폴더가 아닙니다: {source_path}")
         return False
     return True
@@ -185,7 +195,43 @@ def confirm_execution(dry_run: bool) -> bool:
         return False
 
 
-def print_final_summary(result: PipelineResult, dry_run: bool):
+# 진행 바 출력 상태 (동일 칸 수의 잦은 재출력을 억제)
+_PROGRESS_BAR_LENGTH = 30
+_PROGRESS_INTERVAL = 0.1  # 초 (최대 ~10Hz)
+# 채워진 칸 수(0~30)별 진행 바 문자열을 미리 생성
+_BARS = ['█' * i + '░' * (_PROGRESS_BAR_LENGTH - i) for i in range(_PROGRESS_BAR_LENGTH + 1)]
+_last_progress = {'filled': -1, 't': 0.0}
+_PROGRESS_NAME_LEN = 40
+# 파일명 칸은 43자 고정폭 (짧은 이름 출력 시 이전 줄의 잔여 문자 제거)
+_PROGRESS_TEMPLATE = "\r[{0}] {1}/{2} ({3:5.1f}%) - {4:<43.43}"
+
+
+def print_progress(current: int, total: int, filename: str, task: Optional['NovelTask'] = None):
+    """CLI 진행 바 출력 (PipelineOrchestrator progress_callback)
+
+    Stage 2는 (current, total, filename, task) 4개 인자로 호출하므로 task도 받아 둡니다.
+    (3개 인자만 받으면 파일마다 TypeError 후 재호출이 발생)
+    """
+    if total <= 0:
+        return
+
+    filled = min(_PROGRESS_BAR_LENGTH * current // total, _PROGRESS_BAR_LENGTH)
+    now = time.monotonic()
+
+    # 칸 수가 같고 마지막 출력 후 충분한 시간이 지나지 않았으면 생략 (마지막 파일은 항상 출력)
+    if (current < total and filled == _last_progress['filled']
+            and now - _last_progress['t'] < _PROGRESS_INTERVAL):
+        return
+    _last_progress['filled'] = filled
+    _last_progress['t'] = now
+
+    if len(filename) > _PROGRESS_NAME_LEN:
+        filename = f"{filename[:_PROGRESS_NAME_LEN]}..."
+    sys.stdout.write(_PROGRESS_TEMPLATE.format(_BARS[filled], current, total, current / total * 100, filename))
+    sys.stdout.flush()
+
+
+def print_final_summary(result: 'PipelineResult', dry_run: bool):
     mode = "미리보기" if dry_run else "실행"
     print("\n\n" + "=" * 60)
     print(f"✅ 파이프라인 {mode} 완료")
@@ -215,7 +261,15 @@ def run_pipeline(
     dry_run: bool,
     log_level: str,
     config_path: Optional[str] = None
-) -> PipelineResult:
+) -> 'PipelineResult':
+    from core.utils.env import ensure_env_loaded
+    from core.pipeline_orchestrator import PipelineOrchestrator
+    from core.pipeline_logger import PipelineLogger
+    from config.pipeline_config import PipelineConfig
+
+    # 환경 변수 로드 (API 키, CHROMEDRIVER_PATH 등) - GUI는 윈도우 생성 시 로드
+    ensure_env_loaded()
+
     if config_path:
         config = PipelineConfig.load(Path(config_path))
     else:
@@ -227,7 +281,7 @@ def run_pipeline(
     config.dry_run = dry_run
 
     logger = PipelineLogger(log_level=log_level, console_output=False)
-    orchestrator = PipelineOrchestrator(config, logger)
+    orchestrator = PipelineOrchestrator(config, logger, progress_callback=print_progress)
 
     print("\n🚀 파이프라인 시작...\n")
     return orchestrator.run(source_folder, dry_run=dry_run)
@@ -237,6 +291,11 @@ def run_pipeline(
 # 메인 진입점
 # ============================================================================
 def main():
+    # 인자 없이 실행하면 파서 생성 없이 바로 GUI 모드
+    if len(sys.argv) == 1:
+        run_gui()
+        return
+
     parser = create_parser()
     args = parser.parse_args()
 
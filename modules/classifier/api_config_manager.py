@@ -6,20 +6,56 @@ import os
 import sys
 import json
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
-from dotenv import load_dotenv
+import logging
 
-# .env 파일 로드 (시스템 변수보다 우선)
-load_dotenv(override=True)
+from core.utils.env import ensure_env_loaded
+
+# 설정 파일 파싱: orjson이 있으면 사용 (bytes 직접 파싱, 없으면 표준 json)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# cryptography(cffi/OpenSSL 바인딩)는 로드 비용이 커서 실제 사용 시점에 import
+
+
+def _derive_aead_key(cipher_key):
+    """
+    키 파일 값에서 AES-256-GCM 키 파생
+    
+    키 파일은 기존 Fernet 키(urlsafe base64, 32 bytes) 형식을 그대로 사용하고,
+    이전 버전 설정 복호화용 Fernet 키와 분리되도록 HKDF로 별도 키를 만듭니다.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b'wnap-config-aesgcm'
+    ).derive(base64.urlsafe_b64decode(cipher_key))
+
+
+# 설정/키 파일 기준 경로 (PyInstaller 환경 고려, import 시 1회 계산)
+if getattr(sys, 'frozen', False):
+    _APP_DIR = os.path.dirname(sys.executable)
+else:
+    _APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 키 파일 경로별 암호화 키 캐시 (프로세스당 디스크 읽기/키 파생 1회)
+_KEY_CACHE: dict[str, bytes] = {}
 
 
 class APIConfigManager:
     """API 설정 암호화 관리자"""
     
+    # 모든 인스턴스가 공유하는 AESGCM (키는 머신별로 고정이므로 프로세스당 1회 생성)
+    _SHARED_CIPHER = None
+    _SHARED_KEY = None
+    
     def __init__(self, config_file='naver_api_config.json'):
         """
         초기화
@@ -30,38 +66,51 @@ class APIConfigManager:
         self.config_file = config_file
         self.key_file = '.api_key'  # 암호화 키 저장 파일 (숨김 파일)
         
-        # 암호화 키 생성 또는 로드
-        self.cipher_key = self._get_or_create_key()
-        self.cipher = Fernet(self.cipher_key)
+        # 파일에서 로드(복호화)한 설정 캐시 ('naver' / ('google', 파일명))
+        self._config_cache = {}
+        
+        # 암호화 키/객체는 실제 암복호화 시점에 생성
+        # (.env 환경변수로 설정하는 경우 키 파일 접근과 cryptography 로드를 생략)
+        self._cipher_key = None
+        self._cipher = None
+    
+    @property
+    def cipher_key(self):
+        """암호화 키 (최초 접근 시 생성 또는 로드)"""
+        if self._cipher_key is None:
+            self._cipher_key = self._get_or_create_key()
+        return self._cipher_key
+    
+    @property
+    def cipher(self):
+        """AES-GCM 암호화 객체 (최초 접근 시 생성, 같은 키를 쓰는 인스턴스끼리 공유)"""
+        if self._cipher is None:
+            cipher_key = self.cipher_key
+            if APIConfigManager._SHARED_CIPHER is None or APIConfigManager._SHARED_KEY != cipher_key:
+                from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+                APIConfigManager._SHARED_CIPHER = AESGCM(_derive_aead_key(cipher_key))
+                APIConfigManager._SHARED_KEY = cipher_key
+            self._cipher = APIConfigManager._SHARED_CIPHER
+        return self._cipher
     
     def _get_or_create_key(self):
         """암호화 키 생성 또는 로드"""
-        # PyInstaller 환경 고려
-        if getattr(sys, 'frozen', False):
-            application_path = os.path.dirname(sys.executable)
-        else:
-            application_path = os.path.dirname(os.path.abspath(__file__))
+        key_path = os.path.join(_APP_DIR, self.key_file)
         
-        key_path = os.path.join(application_path, self.key_file)
+        cached_key = _KEY_CACHE.get(key_path)
+        if cached_key is not None:
+            return cached_key
         
         if os.path.exists(key_path):
             # 기존 키 로드
             with open(key_path, 'rb') as f:
-                return f.read()
+                key = f.read()
+            _KEY_CACHE[key_path] = key
+            return key
         else:
-            # 새 키 생성
-            # 머신별 고유 키 생성 (머신 ID 기반)
-            machine_id = self._get_machine_id()
-            
-            # PBKDF2HMAC로 키 파생
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b'genre_classifier_salt',  # 고정 salt
-                iterations=100000,
-                backend=default_backend()
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
+            # 새 키 생성 (키는 키 파일에 저장되므로 머신 정보에서 파생하지 않고 무작위로 생성)
+            key = base64.urlsafe_b64encode(os.urandom(32))
+            _KEY_CACHE[key_path] = key
             
             # 키 저장
             with open(key_path, 'wb') as f:
@@ -76,14 +125,23 @@ class APIConfigManager:
             
             return key
     
-    def _get_machine_id(self):
-        """머신 고유 ID 생성"""
-        import platform
-        import uuid
+    def _decrypt(self, data):
+        """
+        암호화된 설정 데이터 복호화
+        
+        Args:
+            data: 설정 파일 JSON ('data', AES-GCM이면 'nonce' 포함)
+        
+        Returns:
+            bytes: 복호화된 평문 JSON
+        """
+        encrypted_data = base64.b64decode(data['data'])
+        if 'nonce' in data:
+            return self.cipher.decrypt(base64.b64decode(data['nonce']), encrypted_data, None)
         
-        # 여러 정보를 조합하여 고유 ID 생성
-        machine_info = f"{platform.node()}-{uuid.getnode()}"
-        return machine_info
+        # 이전 버전(Fernet) 형식 - 다시 저장하면 AES-GCM 형식으로 변환됨
+        from cryptography.fernet import Fernet
+        return Fernet(self.cipher_key).decrypt(encrypted_data)
     
     def save_config(self, client_id, client_secret, encrypt=True):
         """
@@ -105,34 +163,32 @@ class APIConfigManager:
             }
             
             if encrypt:
-                # 암호화
+                # 암호화 (AES-GCM, 매번 새 nonce)
                 config_json = json.dumps(config)
-                encrypted_data = self.cipher.encrypt(config_json.encode())
+                nonce = os.urandom(12)
+                encrypted_data = self.cipher.encrypt(nonce, config_json.encode(), None)
                 
                 # Base64 인코딩하여 저장 (JSON 호환)
                 save_data = {
                     'encrypted': True,
+                    'nonce': base64.b64encode(nonce).decode(),
                     'data': base64.b64encode(encrypted_data).decode()
                 }
             else:
                 # 평문 저장
                 save_data = config
             
-            # 파일 저장 (PyInstaller 환경 고려)
-            if getattr(sys, 'frozen', False):
-                application_path = os.path.dirname(sys.executable)
-            else:
-                application_path = os.path.dirname(os.path.abspath(__file__))
-            
-            config_path = os.path.join(application_path, self.config_file)
+            # 파일 저장
+            config_path = os.path.join(_APP_DIR, self.config_file)
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(save_data, f, indent=2, ensure_ascii=False)
+            self._config_cache.pop('naver', None)
             
-            print(f"[API Config] 설정 저장 완료 (암호화: {'예' if encrypt else '아니오'})")
+            logger.info("[API Config] 설정 저장 완료 (암호화: %s)", '예' if encrypt else '아니오')
             return True
             
         except Exception as e:
-            print(f"[API Config] 저장 실패: {e}")
+            logger.warning("[API Config] 저장 실패: %s", e)
             return False
     
     def load_config(self):
@@ -142,53 +198,53 @@ class APIConfigManager:
         Returns:
             dict: {'client_id': str, 'client_secret': str} 또는 None
         """
+        ensure_env_loaded()
+        
         # 1. 환경변수 확인 (.env)
         env_client_id = os.getenv("NAVER_CLIENT_ID")
         env_client_secret = os.getenv("NAVER_CLIENT_SECRET")
         
         if env_client_id and env_client_secret:
-            print(f"[API Config] .env 환경변수에서 설정 로드 완료")
+            logger.debug("[API Config] .env 환경변수에서 설정 로드 완료")
             return {
                 'client_id': env_client_id,
                 'client_secret': env_client_secret
             }
 
+        cached = self._config_cache.get('naver')
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            # PyInstaller 환경 고려
-            if getattr(sys, 'frozen', False):
-                application_path = os.path.dirname(sys.executable)
-            else:
-                application_path = os.path.dirname(os.path.abspath(__file__))
-            
-            config_path = os.path.join(application_path, self.config_file)
+            config_path = os.path.join(_APP_DIR, self.config_file)
             
-            if not os.path.exists(config_path):
-                print(f"[API Config] 설정 파일 없음: {config_path}")
+            try:
+                with open(config_path, 'rb') as f:
+                    data = _json_loads(f.read())
+            except FileNotFoundError:
+                logger.debug("[API Config] 설정 파일 없음: %s", config_path)
                 return None
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             # 암호화된 데이터인지 확인
             if data.get('encrypted'):
                 # 복호화
-                encrypted_data = base64.b64decode(data['data'])
-                decrypted_data = self.cipher.decrypt(encrypted_data)
-                config = json.loads(decrypted_data.decode())
+                config = _json_loads(self._decrypt(data))
                 
-                print(f"[API Config] 암호화된 설정 로드 완료")
+                logger.debug("[API Config] 암호화된 설정 로드 완료")
             else:
                 # 평문 데이터
                 config = data
-                print(f"[API Config] 평문 설정 로드 완료")
+                logger.debug("[API Config] 평문 설정 로드 완료")
             
-            return {
+            result = {
                 'client_id': config.get('client_id'),
                 'client_secret': config.get('client_secret')
             }
+            self._config_cache['naver'] = result
+            return dict(result)
             
         except Exception as e:
-            print(f"[API Config] 로드 실패: {e}")
+            logger.warning("[API Config] 로드 실패: %s", e)
             return None
     
     def load_google_config(self, config_file='google_api_config.json'):
@@ -200,53 +256,54 @@ class APIConfigManager:
         Returns:
             dict: {'api_key': str, 'cse_id': str} 또는 None
         """
+        ensure_env_loaded()
+        
         # 1. 환경변수 확인 (.env)
         env_api_key = os.getenv("GOOGLE_API_KEY")
         env_cse_id = os.getenv("GOOGLE_CSE_ID")
         
         if env_api_key and env_cse_id:
-            print(f"[API Config] .env 환경변수에서 Google 설정 로드 완료")
+            logger.debug("[API Config] .env 환경변수에서 Google 설정 로드 완료")
             return {
                 'api_key': env_api_key,
                 'cse_id': env_cse_id
             }
 
+        cache_key = ('google', config_file)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            # PyInstaller 환경 고려
-            if getattr(sys, 'frozen', False):
-                application_path = os.path.dirname(sys.executable)
-            else:
-                application_path = os.path.dirname(os.path.abspath(__file__))
+            config_path = os.path.join(_APP_DIR, config_file)
             
-            config_path = os.path.join(application_path, config_file)
-            
-            if not os.path.exists(config_path):
-                # print(f"[API Config] Google 설정 파일 없음: {config_path}")
+            try:
+                with open(config_path, 'rb') as f:
+                    data = _json_loads(f.read())
+            except FileNotFoundError:
+                logger.debug("[API Config] Google 설정 파일 없음: %s", config_path)
                 return None
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             # 암호화된 데이터인지 확인
             if data.get('encrypted'):
                 # 복호화
-                encrypted_data = base64.b64decode(data['data'])
-                decrypted_data = self.cipher.decrypt(encrypted_data)
-                config = json.loads(decrypted_data.decode())
+                config = _json_loads(self._decrypt(data))
                 
-                print(f"[API Config] 암호화된 Google 설정 로드 완료")
+                logger.debug("[API Config] 암호화된 Google 설정 로드 완료")
             else:
                 # 평문 데이터
                 config = data
-                print(f"[API Config] 평문 Google 설정 로드 완료")
+                logger.debug("[API Config] 평문 Google 설정 로드 완료")
             
-            return {
+            result = {
                 'api_key': config.get('api_key'),
                 'cse_id': config.get('cse_id')
             }
+            self._config_cache[cache_key] = result
+            return dict(result)
             
         except Exception as e:
-            print(f"[API Config] Google 설정 로드 실패: {e}")
+            logger.warning("[API Config] Google 설정 로드 실패: %s", e)
             return None
 
     def migrate_to_encrypted(self):
@@ -262,83 +319,5 @@ class APIConfigManager:
                 )
             return False
         except Exception as e:
-            print(f"[API Config] 마이그레이션 실패: {e}")
+            logger.warning("[API Config] 마이그레이션 실패: %s", e)
             return False
-
-
-def test_encryption():
-    """암호화 테스트"""
-    print("="*60)
-    print("API 설정 암호화 테스트")
-    print("="*60)
-    print()
-    
-    manager = APIConfigManager('test_config.json')
-    
-    # 1. 암호화 저장
-    print("1. 암호화 저장 테스트...")
-    test_id = "test_client_id_12345"
-    test_secret = "test_client_secret_67890"
-    
-    success = manager.save_config(test_id, test_secret, encrypt=True)
-    print(f"   저장 결과: {'성공' if success else '실패'}")
-    print()
-    
-    # 2. 암호화 로드
-    print("2. 암호화 로드 테스트...")
-    config = manager.load_config()
-    
-    if config:
-        print(f"   Client ID: {config['client_id']}")
-        print(f"   Client Secret: {config['client_secret']}")
-        
-        # 검증
-        if config['client_id'] == test_id and config['client_secret'] == test_secret:
-            print("   ✅ 암호화/복호화 성공!")
-        else:
-            print("   ❌ 데이터 불일치!")
-    else:
-        print("   ❌ 로드 실패!")
-    
-    print()
-    
-    # 3. 파일 내용 확인
-    print("3. 저장된 파일 내용 (암호화됨):")
-    try:
-        with open('test_config.json', 'r', encoding='utf-8') as f:
-            content = f.read()
-            print(f"   {content[:200]}...")
-    except:
-        pass
-    
-    print()
-    
-    # 4. 평문 저장 테스트
-    print("4. 평문 저장 테스트...")
-    manager.save_config(test_id, test_secret, encrypt=False)
-    
-    print("   저장된 파일 내용 (평문):")
-    try:
-        with open('test_config.json', 'r', encoding='utf-8') as f:
-            content = f.read()
-            print(f"   {content}")
-    except:
-        pass
-    
-    print()
-    
-    # 5. 정리
-    print("5. 테스트 파일 정리...")
-    try:
-        os.remove('test_config.json')
-        os.remove('.api_key')
-        print("   ✅ 정리 완료")
-    except:
-        pass
-    
-    print()
-    print("="*60)
-
-
-if __name__ == '__main__':
-    test_encryption()
@@ -6,16 +6,36 @@
 버전은 core/version.py에서 중앙 관리됩니다.
 """
 
-import os
 import re
 import sys
 
 from modules.classifier.src.core.hybrid_classifier_v2 import HybridClassifier
 
 
+# extract_title_from_filename 정규식 (파일마다 호출되므로 모듈 로드 시 1회 컴파일)
+_RE_RANGE = re.compile(r'\s+\d+[-~]\d+[화권부편]?\s*(?:\(완\))?')
+_RE_BRACKET_META = re.compile(r'\s*\[(단행본|완결|연재중|개정판|합본|개정|특별판|장르|작가|판타지|무협|로맨스|BL)\]\s*', re.IGNORECASE)
+# 괄호 부가정보 제거와 "+ 외전" 꼬리 제거는 서로의 결과에 영향을 주지 않으므로 한 번의 스캔으로 처리
+# (나머지 패턴은 앞 단계 제거 결과에 따라 매칭이 달라지므로 순서대로 별도 적용)
+_RE_PAREN_META_OR_PLUS_TAIL = re.compile(
+    r'\s*\((?:완결|연재중|개정판|합본|개정|특별판|완|19금|19N|19n|19|15금|15|N|n)\)\s*'
+    r'|\s*\+.*$',
+    re.IGNORECASE
+)
+_RE_UNIT_NUMBER = re.compile(r'[\s_\-]+\d+[화권부편](?=\s|$)')
+_RE_NUMBER_TAIL = re.compile(r'[_\-]+\d+$')
+_RE_UNDERSCORES = re.compile(r'_+')
+_RE_WS = re.compile(r'\s+')
+
+
 class FilenameGenreClassifier:
     """파일명 기반 장르 분류기"""
     
+    # classify_files 기본 동시 분류 스레드 수
+    # 웹 크롤링은 요청마다 브라우저(Selenium)를 띄울 수 있으므로 네이버 API를 쓸 때만 병렬 처리
+    API_WORKERS = 8
+    CRAWL_WORKERS = 1
+    
     def __init__(self):
         self.classifier = HybridClassifier()
     
@@ -30,30 +50,30 @@ class FilenameGenreClassifier:
         - "나 혼자 소드 마스터 1-1031 (완) + 외전 1-79, 에필" → "나 혼자 소드 마스터"
         - "눈 감고 3점 슛 1-424 (완).txt" → "눈 감고 3점 슛"
         """
-        # 확장자 제거
-        name = os.path.splitext(filename)[0]
+        # 확장자 제거 (파일명만 전달되므로 경로 구분자는 고려하지 않음)
+        # ".hidden"처럼 앞쪽 점만 있는 경우는 splitext와 동일하게 확장자로 보지 않음
+        stem = filename.rpartition('.')[0]
+        name = stem if stem.lstrip('.') else filename
         
         # 숫자 범위 패턴 제거 (하이픈으로 연결된 두 숫자)
         # "트립한국 1913 1-126 (완)" → "트립한국 1913 (완)"
         # 범위 패턴: "1-247", "1~247" (하이픈/틸드로 연결된 숫자)
         # 단독 숫자는 제목의 일부이므로 유지: "1913"
-        name = re.sub(r'\s+\d+[-~]\d+[화권부편]?\s*(?:\(완\))?', ' ', name)  # "1-247 (완)" 제거
+        name = _RE_RANGE.sub(' ', name)  # "1-247 (완)" 제거
         
         # 부가 정보 제거 - 괄호는 제거하되 내용은 유지
         # "[단행본]" → 제거, "(완결)" → 제거 (특정 키워드만)
         # 하지만 "(여자)" 같은 제목의 일부는 괄호만 제거하고 내용 유지
         
         # 1. 명확한 부가 정보 키워드는 괄호와 함께 제거
-        name = re.sub(r'\s*\[(단행본|완결|연재중|개정판|합본|개정|특별판|장르|작가|판타지|무협|로맨스|BL)\]\s*', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*\((완결|연재중|개정판|합본|개정|특별판|완|19금|19N|19n|19|15금|15|N|n)\)\s*', '', name, flags=re.IGNORECASE)
+        # "+ 외전", "+ 에필", "+ 특별편" 등도 함께 제거 (+ 이후 모두 제거)
+        name = _RE_BRACKET_META.sub('', name)
+        name = _RE_PAREN_META_OR_PLUS_TAIL.sub('', name)
         
         # 2. 나머지 괄호는 그대로 유지 (extract_genre_from_title에서 처리)
         # "광불화형전(화형령주)" → "광불화형전(화형령주)" (유지)
         # 괄호 내용은 부제일 수 있으므로 extract_genre_from_title에서 분리
         
-        # "+ 외전", "+ 에필", "+ 특별편" 등 제거 (+ 이후 모두 제거)
-        name = re.sub(r'\s*\+.*$', '', name)
-        
         # 작가명 제거는 extract_genre_from_title에서 처리
         # "구룡겁 - 천중행,천중화" → "구룡겁 - 천중행,천중화" (유지)
         # 복수 저자, 단일 저자 모두 extract_genre_from_title에서 처리
@@ -62,19 +82,19 @@ class FilenameGenreClassifier:
         # 패턴: 공백이나 구분자 뒤의 숫자+단위 (뒤에 조사가 없는 경우만)
         # 보존: "2부를", "3권을" (조사가 붙은 경우)
         # 제거: " 1화", " 50권" (뒤에 공백이나 끝이 오는 경우)
-        name = re.sub(r'[\s_\-]+\d+[화권부편](?=\s|$)', '', name)
+        name = _RE_UNIT_NUMBER.sub('', name)
         
         # 끝부분의 언더스코어/하이픈 + 숫자 제거 (_001, -50 등)
         # 단, 공백 + 숫자는 제목의 일부일 수 있으므로 제거하지 않음
         # "트립한국 1913" (유지), "파일명_001" (제거)
-        name = re.sub(r'[_\-]+\d+$', '', name)
+        name = _RE_NUMBER_TAIL.sub('', name)
         
         # 특수문자 정리 (_ 만 공백으로, - 는 유지)
         # - 는 저자명 구분자로 사용되므로 유지 (예: "제목 - 저자")
-        name = re.sub(r'_+', ' ', name)
+        name = _RE_UNDERSCORES.sub(' ', name)
         
         # 연속된 공백을 하나로
-        name = ' '.join(name.split())
+        name = _RE_WS.sub(' ', name)
         
         return name.strip()
     
@@ -101,6 +121,60 @@ class FilenameGenreClassifier:
         title = self.extract_title_from_filename(filename)
         
         if not title:
+            return self._build_result(filename, None, None)
+        
+        # 장르 분류
+        result = self.classifier.classify(title, use_naver=use_naver, naver_api_config=naver_api_config)
+        
+        return self._build_result(filename, title, result)
+    
+    def classify_files(self, filenames, use_naver=True, naver_api_config=None, max_workers=None):
+        """
+        여러 파일명을 한 번에 장르 분류
+        
+        같은 제목으로 추출되는 파일(1권/2권 분할본 등)은 한 번만 분류하고,
+        max_workers가 2 이상이면 서로 다른 제목을 스레드 풀로 동시에 조회합니다
+        (네이버/웹 검색 대기 시간 중첩).
+        
+        동시 조회 시 모든 스레드가 같은 HybridClassifier를 사용하며,
+        분류 과정의 print 출력(콘솔/로그)은 서로 다른 제목끼리 섞여 나올 수 있습니다.
+        
+        Args:
+            filenames: 파일명 목록
+            use_naver: 네이버 검색 사용 여부
+            naver_api_config: 네이버 API 설정 (dict with 'client_id', 'client_secret')
+            max_workers: 동시 분류 스레드 수
+                (None이면 네이버 API 사용 시 API_WORKERS, 그 외에는 CRAWL_WORKERS = 순차 처리)
+            
+        Returns:
+            list: 입력 순서대로 classify_file()과 같은 형식의 결과 목록
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if max_workers is None:
+            max_workers = self.API_WORKERS if use_naver and naver_api_config else self.CRAWL_WORKERS
+        
+        titles = [self.extract_title_from_filename(filename) for filename in filenames]
+        unique_titles = [title for title in dict.fromkeys(titles) if title]
+        
+        def classify_title(title):
+            return self.classifier.classify(title, use_naver=use_naver, naver_api_config=naver_api_config)
+        
+        if len(unique_titles) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_titles))) as executor:
+                classified = dict(zip(unique_titles, executor.map(classify_title, unique_titles)))
+        else:
+            classified = {title: classify_title(title) for title in unique_titles}
+        
+        return [
+            self._build_result(filename, title or None, classified.get(title))
+            for filename, title in zip(filenames, titles)
+        ]
+    
+    @staticmethod
+    def _build_result(filename, title, result):
+        """classify_file() 반환 형식 구성 (result가 None이면 제목 추출 실패)"""
+        if result is None:
             return {
                 'filename': filename,
                 'title': None,
@@ -110,9 +184,6 @@ class FilenameGenreClassifier:
                 'details': None
             }
         
-        # 장르 분류
-        result = self.classifier.classify(title, use_naver=use_naver, naver_api_config=naver_api_config)
-        
         return {
             'filename': filename,
             'title': title,
@@ -126,36 +197,3 @@ class FilenameGenreClassifier:
         """리소스 정리"""
         if hasattr(self.classifier, 'close'):
             self.classifier.close()
-
-
-def test_title_extraction():
-    """제목 추출 테스트"""
-    classifier = FilenameGenreClassifier()
-    
-    test_cases = [
-        ("나 혼자 소드 마스터 1-1031 (완) + 외전 1-79, 에필.txt", "나 혼자 소드 마스터"),
-        ("눈 감고 3점 슛 1-424 (완).txt", "눈 감고 3점 슛"),
-        ("화산귀환 1-50화.txt", "화산귀환"),
-        ("[판타지] 전지적 독자 시점 1-551 (완).epub", "전지적 독자 시점"),
-        ("금리낭자 1-141 (완).txt", "금리낭자"),
-        ("나혼자만레벨업_001.txt", "나혼자만레벨업"),
-    ]
-    
-    print("="*80)
-    print("제목 추출 테스트")
-    print("="*80)
-    
-    for filename, expected in test_cases:
-        result = classifier.extract_title_from_filename(filename)
-        status = "✅" if result == expected else "❌"
-        print(f"\n{status} {filename}")
-        print(f"   예상: {expected}")
-        print(f"   결과: {result}")
-        if result != expected:
-            print(f"   ⚠️  불일치!")
-    
-    print("\n" + "="*80)
-
-
-if __name__ == "__main__":
-    test_title_extraction()
@@ -6,76 +6,198 @@ tkinter 기반 사용자 인터페이스 - 좌우 분할 형태
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import tkinter.font as tkfont
 import os
 import json
 import shutil
+import io
+import re
 import sys
+import time
+import atexit
+import functools
+import hashlib
+import itertools
+import unicodedata
+from collections import Counter, defaultdict, deque
 from datetime import datetime
 from core.version import __version__, __app_name__ as __version_name__, get_full_version as get_full_version_string
 from modules.classifier.filename_genre_classifier import FilenameGenreClassifier
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 창 제목/타이틀 라벨에 쓰는 버전 문자열 (import 시 1회 생성)
+_VERSION_STRING = get_full_version_string()
 
 
 # 로그 파일 설정
 class TeeOutput:
-    """콘솔과 파일에 동시에 출력"""
+    """
+    콘솔과 파일에 동시에 출력 (파일 쪽은 버퍼에 모아 두었다가 기록)
+    
+    파일 버퍼는 가득 차거나, 쓰기 시점에 마지막 기록 후 FLUSH_INTERVAL(초)이 지났으면 기록합니다.
+    시간 경과만으로는 기록되지 않으므로 출력이 멈추는 시점(분류 완료, 종료)에는 flush()를 호출합니다.
+    """
+    
+    # 파일 버퍼 크기(bytes), 쓰기 시 경과 시간 기준 기록 간격(초)
+    BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 1.0
+    
     def __init__(self, file_path):
         self.terminal = sys.stdout
         try:
-            self.log = open(file_path, 'w', encoding='utf-8')
+            # 텍스트 계층 없이 UTF-8로 한 번만 인코딩해 바이너리 버퍼에 기록
+            self.log = io.BufferedWriter(open(file_path, 'wb', buffering=0), self.BUFFER_SIZE)
         except:
             self.log = None
-    
-    def write(self, message):
-        # PyInstaller 환경에서 sys.stdout이 None일 수 있음
-        if self.terminal is not None:
-            try:
-                self.terminal.write(message)
-            except:
-                pass
         
-        if self.log is not None:
-            try:
-                self.log.write(message)
-                self.log.flush()
-            except:
-                pass
-    
-    def flush(self):
-        if self.terminal is not None:
-            try:
-                self.terminal.flush()
-            except:
-                pass
+        self._last_flush = time.monotonic()
         
+        self._bind_methods()
+        
+        # 비정상 종료 직전까지의 로그가 남도록 종료 시 버퍼 기록
+        atexit.register(self.close)
+    
+    def _bind_methods(self):
+        """
+        출력 대상(콘솔/파일) 유무에 맞는 write/flush 구현을 인스턴스에 바인딩
+        
+        PyInstaller 환경에서 sys.stdout이 None일 수 있고 로그 파일 열기가 실패할 수 있으므로,
+        호출마다 None 검사를 하지 않도록 생성 시점(및 close 시점)에 한 번만 결정합니다.
+        """
+        if self.terminal is not None and self.log is not None:
+            self.write, self.flush = self._write_both, self._flush_both
+        elif self.terminal is not None:
+            self.write, self.flush = self._write_terminal_only, self._flush_terminal_only
+        elif self.log is not None:
+            self.write, self.flush = self._write_log_only, self._flush_buffer
+        else:
+            self.write, self.flush = self._write_noop, self._flush_noop
+    
+    def _write_both(self, message):
+        try:
+            self.terminal.write(message)
+        except:
+            pass
+        self._write_log_only(message)
+    
+    def _write_terminal_only(self, message):
+        try:
+            self.terminal.write(message)
+        except:
+            pass
+    
+    def _write_log_only(self, message):
+        try:
+            self.log.write(message.encode('utf-8', errors='replace'))
+        except:
+            pass
+        if time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+            self._flush_buffer()
+    
+    def _write_noop(self, message):
+        pass
+    
+    def _flush_buffer(self):
+        """버퍼 내용을 로그 파일에 기록"""
+        self._last_flush = time.monotonic()
+        try:
+            self.log.flush()
+        except:
+            pass
+    
+    def _flush_both(self):
+        self._flush_terminal_only()
+        self._flush_buffer()
+    
+    def _flush_terminal_only(self):
+        try:
+            self.terminal.flush()
+        except:
+            pass
+    
+    def _flush_noop(self):
+        pass
+    
+    def close(self):
         if self.log is not None:
+            self._flush_buffer()
             try:
-                self.log.flush()
+                os.fsync(self.log.fileno())
             except:
                 pass
-    
-    def close(self):
-        if self.log is not None:
             try:
                 self.log.close()
             except:
                 pass
+            self.log = None
+            self._bind_methods()
+
+
+class ThreadCapturedOutput:
+    """
+    작업 스레드별 출력을 모아 두는 sys.stdout 대리 객체
+
+    동시 분류 중에는 각 작업 스레드의 print 출력을 스레드별 목록에 모으고,
+    파일 하나의 분류가 끝나면 그 출력을 한 덩어리로 돌려줍니다.
+    (캡처 중이 아닌 스레드의 출력은 그대로 원래 stream으로 전달)
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, message):
+        lines = getattr(self._local, 'lines', None)
+        if lines is None:
+            return self.stream.write(message)
+        lines.append(message)
+        return len(message)
+    
+    def flush(self):
+        if getattr(self._local, 'lines', None) is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+    
+    def run(self, func, *args, **kwargs):
+        """func 실행 중 현재 스레드의 출력을 모아 (결과, 출력 문자열) 반환 (예외 시 모은 출력을 바로 기록)"""
+        self._local.lines = lines = []
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            self._local.lines = None
+            self.stream.write(''.join(lines))
+            raise
+        self._local.lines = None
+        return result, ''.join(lines)
+
+
+# 실행 기준 경로 (PyInstaller 환경 고려, import 시 1회 계산)
+if getattr(sys, 'frozen', False):
+    # PyInstaller로 빌드된 실행 파일
+    APPLICATION_PATH = os.path.dirname(sys.executable)
+else:
+    # 일반 Python 스크립트
+    APPLICATION_PATH = os.path.dirname(os.path.abspath(__file__))
 
 
 # 로그 파일 경로 (PyInstaller 환경 고려)
 def get_log_file_path():
     """로그 파일 경로 가져오기 (PyInstaller 환경 고려)"""
-    if getattr(sys, 'frozen', False):
-        # PyInstaller로 빌드된 실행 파일
-        application_path = os.path.dirname(sys.executable)
-    else:
-        # 일반 Python 스크립트
-        application_path = os.path.dirname(os.path.abspath(__file__))
-    
-    return os.path.join(application_path, 'debugging_list.txt')
+    return os.path.join(APPLICATION_PATH, 'debugging_list.txt')
 
 LOG_FILE = get_log_file_path()
 
+
+def get_classify_cache_path():
+    """분류 결과 캐시 파일 경로 (로그 파일과 같은 위치)"""
+    return os.path.join(APPLICATION_PATH, 'classify_cache.json')
+
+# 분류 캐시 키 형식 버전 (키 구성이 바뀌면 올려서 이전 캐시를 버림)
+CLASSIFY_CACHE_FORMAT = 2
+
 # stdout을 파일과 콘솔에 동시 출력하도록 설정
 try:
     tee_output = TeeOutput(LOG_FILE)
@@ -92,16 +214,382 @@ except Exception as e:
     pass
 
 
+# ============================================================================
+# 분류 방법 → 출처 표시 (_simplify_method에서 사용, import 시 1회 구성)
+# ============================================================================
+
+# 방법별 출처 표시 (플랫폼 이름 우선)
+_METHOD_MAPPING = {
+    # 네이버 검색 기반 - 플랫폼 이름 표시
+    'naver_ridibooks_meta_priority': '리디북스',
+    'naver_ridibooks_priority': '리디북스',
+    'naver_novelpia_priority': '노벨피아',
+    'naver_novelpia_hashtag': '노벨피아',
+    'naver_novelpia_hashtag_analysis': '노벨피아',
+    'naver_munpia_priority': '문피아',
+    'naver_naver_series_priority': '네이버시리즈',
+    'naver_kakao_priority': '카카오페이지',
+    
+    # 재매핑 - 플랫폼+키워드
+    'naverseries_keyword_refined': '키워드+네이버시리즈',
+    'naverseriesports_refined': '키워드+네이버시리즈',
+    'naverseries_sports_refined': '키워드+네이버시리즈',
+    'kakaopage_keyword_refined': '키워드+카카오페이지',
+    'kakaopagesports_refined': '키워드+카카오페이지',
+    'kakaopage_sports_refined': '키워드+카카오페이지',
+    'ridibooks_history_refined': '키워드+리디북스',
+    'ridibookssports_refined': '키워드+리디북스',
+    'ridibooks_sports_refined': '키워드+리디북스',
+    'ridibooksgame_refined': '키워드+리디북스',
+    'ridibooks_game_refined': '키워드+리디북스',
+    
+    # 키워드 기반
+    'keyword_only': '키워드',
+    'keyword_high_confidence': '키워드',
+    'keyword_higher_confidence': '키워드',
+    
+    # 특수 케이스
+    'special_case': '키워드',
+    'compound_pattern': '키워드',
+    'manual_edit': '사용자',
+    'author_genre_db': '저자DB',
+    'author_genre_db_fallback': '저자DB',
+    'title_keyword_analysis': '키워드',
+    
+    # 통합 결과 - platform_source 확인 필요
+    'both_agree': None,  # 동적 처리
+    'naver_high_confidence': None,  # 동적 처리
+    'naver_higher_confidence': None,  # 동적 처리
+    'naver_only': None,  # 동적 처리
+    
+    # 신뢰도 부족
+    'low_confidence': '키워드'
+}
+
+# platform_source로 플랫폼 이름을 결정하는 통합 결과 method
+_NAVER_DYNAMIC_METHODS = frozenset(['naver_only', 'naver_high_confidence', 'naver_higher_confidence', 'both_agree'])
+
+# (표시 이름, 검색어 목록) - 앞에서부터 우선순위로 확인, 소문자 문자열 기준
+# 검색어가 튜플이면 모든 단어가 포함되어야 일치
+_SOURCE_PLATFORMS = (
+    ('리디북스', ('ridibooks', '리디북스')),
+    ('노벨피아', ('novelpia', '노벨피아')),
+    ('문피아', ('munpia', '문피아')),
+    ('네이버시리즈', ('naver', '네이버시리즈')),
+    ('카카오페이지', ('kakao', '카카오')),
+    ('소설넷', ('novelnet', '소설넷')),
+    ('미스터블루', ('mrblue', '미스터블루')),
+    ('웹툰가이드', ('webtoonguide', '웹툰가이드')),
+    ('YES24', ('yes24',)),
+    ('교보문고', ('kyobo', '교보문고')),
+    ('알라딘', ('aladin', '알라딘')),
+    ('조아라', ('joar', '조아라')),
+)
+
+# 매핑되지 않은 method 문자열에서 플랫폼 추출 (네이버시리즈는 naver+series 모두 포함 시)
+_METHOD_PLATFORMS = (
+    ('리디북스', ('ridibooks', 'ridi', '리디북스')),
+    ('노벨피아', ('novelpia', '노벨피아')),
+    ('문피아', ('munpia', '문피아')),
+    ('네이버시리즈', (('naver', 'series'), '네이버시리즈')),
+    ('카카오페이지', ('kakao', '카카오')),
+    ('소설넷', ('novelnet', '소설넷')),
+    ('미스터블루', ('mrblue', '미스터블루')),
+    ('웹툰가이드', ('webtoonguide', '웹툰가이드')),
+    ('YES24', ('yes24',)),
+    ('교보문고', ('kyobo', '교보문고')),
+    ('알라딘', ('aladin', '알라딘')),
+    ('조아라', ('joar', '조아라')),
+    ('네이버', ('naver',)),
+)
+
+
+def _compile_token_scanner(tokens):
+    """검색어 목록을 한 번의 스캔으로 찾는 정규식 생성
+    
+    검색어끼리 겹칠 수 있으므로("naveridibooks" 등) 전방 탐색으로 모든 시작 위치의 일치를 찾음
+    """
+    return re.compile(
+        '(?=(' + '|'.join(re.escape(token) for token in sorted(tokens, key=len, reverse=True)) + '))'
+    )
+
+
+# platform_source 검색용: 검색어 -> (우선순위, 플랫폼 이름)
+_SOURCE_PLATFORM_RANK = {
+    needle: (rank, name)
+    for rank, (name, needles) in enumerate(_SOURCE_PLATFORMS)
+    for needle in needles
+}
+_SOURCE_PLATFORM_RE = _compile_token_scanner(_SOURCE_PLATFORM_RANK)
+
+# method 검색용: 단일 검색어 -> (우선순위, 플랫폼 이름), 복합 검색어는 (우선순위, 플랫폼 이름, 단어 목록)
+_METHOD_PLATFORM_RANK = {
+    needle: (rank, name)
+    for rank, (name, needles) in enumerate(_METHOD_PLATFORMS)
+    for needle in needles
+    if not isinstance(needle, tuple)
+}
+_METHOD_PLATFORM_COMBOS = tuple(
+    (rank, name, needle)
+    for rank, (name, needles) in enumerate(_METHOD_PLATFORMS)
+    for needle in needles
+    if isinstance(needle, tuple)
+)
+_METHOD_KEYWORD_TOKENS = ('keyword', 'refined')
+_METHOD_TOKEN_RE = _compile_token_scanner(
+    set(_METHOD_PLATFORM_RANK)
+    | {part for _, _, parts in _METHOD_PLATFORM_COMBOS for part in parts}
+    | set(_METHOD_KEYWORD_TOKENS)
+)
+
+
+def _find_source_platform(text):
+    """platform_source(소문자)에서 우선순위가 가장 높은 플랫폼 이름 반환 (없으면 None)"""
+    best = None
+    for match in _SOURCE_PLATFORM_RE.finditer(text):
+        candidate = _SOURCE_PLATFORM_RANK[match.group(1)]
+        if best is None or candidate < best:
+            best = candidate
+            if best[0] == 0:
+                break
+    return best[1] if best else None
+
+
+def _scan_method_tokens(text):
+    """method(소문자)를 한 번 스캔해 (우선순위가 가장 높은 플랫폼 이름 또는 None, 발견된 검색어 집합) 반환"""
+    hits = {match.group(1) for match in _METHOD_TOKEN_RE.finditer(text)}
+    if not hits:
+        return None, hits
+    
+    candidates = [_METHOD_PLATFORM_RANK[token] for token in hits if token in _METHOD_PLATFORM_RANK]
+    candidates.extend(
+        (rank, name) for rank, name, parts in _METHOD_PLATFORM_COMBOS
+        if all(part in hits for part in parts)
+    )
+    return (min(candidates)[1] if candidates else None), hits
+
+
+@functools.lru_cache(maxsize=512)
+def _simplify_method_cached(method, platform_source):
+    """method와 네이버 결과의 platform_source로 출처 표시 문자열 계산 (같은 입력은 캐시에서 반환)"""
+    # 매핑된 값이 있으면 사용 (None이 아닌 경우)
+    mapped = _METHOD_MAPPING.get(method)
+    if mapped is not None:
+        return mapped
+    
+    # 네이버 관련 method는 platform_source로 플랫폼 이름 추출
+    if method in _NAVER_DYNAMIC_METHODS:
+        if platform_source:
+            # platform_source에서 플랫폼 이름 추출 (한글 포함)
+            platform_name = _find_source_platform(platform_source.lower()) or '네이버'
+            
+            # both_agree는 키워드+플랫폼
+            if method == 'both_agree':
+                return f'키워드+{platform_name}'
+            else:
+                return platform_name
+        else:
+            # platform_source가 없으면 기본값
+            if method == 'both_agree':
+                return '키워드+네이버'
+            else:
+                return '네이버'
+    
+    # 매핑되지 않은 경우 플랫폼 이름 추출 (한글 포함)
+    method_lower = method.lower()
+    
+    platform_name, tokens = _scan_method_tokens(method_lower)
+    if platform_name:
+        if not tokens.isdisjoint(_METHOD_KEYWORD_TOKENS):
+            return f'키워드+{platform_name}'
+        return platform_name
+    elif 'keyword' in tokens:
+        return '키워드'
+    else:
+        return method[:8]  # 최대 8글자로 제한
+
+
+@functools.lru_cache(maxsize=512)
+def _display_width(text):
+    """고정폭 글꼴에서의 표시 너비 (한글/이모지 등 전각 문자는 2칸)"""
+    return sum(2 if unicodedata.east_asian_width(ch) in 'WF' else 1 for ch in text)
+
+
+def _pad_display(text, width):
+    """표시 너비가 width가 되도록 오른쪽에 공백 추가"""
+    return text + ' ' * max(0, width - _display_width(text))
+
+
+# 파일명 변경 형식별 새 파일명 생성 (filename은 확장자 포함 파일명)
+def _rename_genre_prefix(filename, genre):
+    """[장르] 제목"""
+    return f"[{genre}] {filename}"
+
+
+def _rename_genre_suffix(filename, genre):
+    """제목 [장르] (장르는 확장자 앞에)"""
+    name, ext = os.path.splitext(filename)
+    return f"{name} [{genre}]{ext}"
+
+
+def _rename_genre_underscore(filename, genre):
+    """장르_제목"""
+    return f"{genre}_{filename}"
+
+
+_RENAME_FORMATTERS = {
+    "[장르] 제목": _rename_genre_prefix,
+    "제목 [장르]": _rename_genre_suffix,
+    "장르_제목": _rename_genre_underscore,
+}
+
+
+def _rename_formatter(format_type):
+    """형식 이름에 맞는 새 파일명 생성 함수 (알 수 없는 형식은 장르_제목)"""
+    return _RENAME_FORMATTERS.get(format_type, _rename_genre_underscore)
+
+
+# 상세 텍스트 저장의 구분선
+_SEP_EQ = '=' * 100
+_SEP_DASH = '-' * 100
+
+
+def _fit_text(text, width):
+    """width 글자를 넘으면 잘라서 말줄임표 추가"""
+    return text if len(text) <= width else text[:width - 1] + '…'
+
+
+class _ToggleButton:
+    """
+    tk.Button을 체크박스처럼 사용하는 토글 (BooleanVar 상태에 따라 모양 전환)
+    
+    변수 값이 바뀌면(클릭, 자동 로드, 다른 옵션에 의한 변경 모두) 버튼 모양을 갱신합니다.
+    """
+    
+    def __init__(self, button, var, on_cfg, off_cfg, extra=None):
+        """
+        Args:
+            button: 토글로 사용할 tk.Button
+            var: 상태를 저장하는 tk.BooleanVar
+            on_cfg: 켜짐 상태의 button.config 인자
+            off_cfg: 꺼짐 상태의 button.config 인자
+            extra: 클릭으로 상태가 바뀐 뒤 호출할 함수 (선택)
+        """
+        self.button = button
+        self.var = var
+        self.on_cfg = on_cfg
+        self.off_cfg = off_cfg
+        self.extra = extra
+        
+        button.config(command=self.toggle)
+        var.trace_add('write', self._on_var_write)
+        self.apply()
+    
+    def toggle(self):
+        """클릭 시 상태 반전"""
+        self.var.set(not self.var.get())
+        if self.extra is not None:
+            self.extra()
+    
+    def apply(self):
+        """현재 상태에 맞게 버튼 모양 설정"""
+        self.button.config(**(self.on_cfg if self.var.get() else self.off_cfg))
+    
+    def _on_var_write(self, *args):
+        self.apply()
+
+
 class GenreClassifierGUI:
     """장르 분류기 GUI"""
     
+    # 동시에 분류(검색)할 파일 수 (환경 변수 CLASSIFY_WORKERS_API / CLASSIFY_WORKERS_CRAWL로 변경 가능)
+    # 웹 크롤링은 파일마다 브라우저(Selenium)를 띄울 수 있으므로 기본 순차 처리,
+    # 키워드 분류만 할 때는 네트워크 대기가 없으므로 항상 순차 처리
+    CLASSIFY_WORKERS_API = 8
+    CLASSIFY_WORKERS_CRAWL = 1
+    
+    # 분류 결과 캐시에 보관할 최대 항목 수 (넘으면 오래된 항목부터 삭제)
+    CLASSIFY_CACHE_MAX_ENTRIES = 20000
+    
+    # 분류 결과를 트리뷰에 모아서 반영하는 주기 (ms)
+    ROW_FLUSH_INTERVAL_MS = 100
+    
+    # 분류 중 통계 패널 갱신 최소 간격 (ms)
+    STATS_REFRESH_MS = 250
+    
+    # 분류 중 진행 상태바/라벨 갱신 최소 간격 (ms)
+    PROGRESS_REFRESH_MS = 50
+    
+    # 파일명 변경 탭 표시(<Visibility>) 이벤트를 모아 미리보기를 한 번만 갱신하는 대기 시간 (ms)
+    PREVIEW_REFRESH_MS = 150
+    
+    # 파일명 수정 창에서 입력이 멈춘 뒤 새 파일명 미리보기를 갱신하는 대기 시간 (ms)
+    EDIT_PREVIEW_DELAY_MS = 50
+    
+    # 진행 상황 라벨 너비 (글자 수)
+    PROGRESS_LABEL_WIDTH = 40
+    
+    # 분류 결과 트리뷰 컬럼
+    RESULT_COLUMNS = ('파일명', '제목', '장르', '신뢰도', '출처')
+    
+    # 결과 트리뷰 장르별 행 색상 (배경, 글자)
+    GENRE_TAG_COLORS = {
+        '무협': ('#FF6B6B', 'black'),      # 빨간색 계열
+        '로판': ('#FF69B4', 'black'),      # 핑크색
+        '현판': ('#4ECDC4', 'black'),      # 청록색
+        '퓨판': ('#45B7D1', 'black'),      # 파란색
+        '겜판': ('#96CEB4', 'black'),      # 연두색
+        '선협': ('#FFEAA7', 'black'),      # 노란색
+        '역사': ('#DDA0DD', 'black'),      # 자주색
+        'SF': ('#87CEEB', 'black'),        # 하늘색
+        '스포츠': ('#FFA500', 'black'),    # 주황색
+        '밀리터리': ('#556B2F', 'black'),  # 올리브 그린
+        '패러디': ('#DA70D6', 'black'),    # 오키드
+        '언정': ('#F0A0A0', 'black'),      # 연한 빨간색
+        '현대': ('#B0C4DE', 'black'),      # 연한 파란색
+        '소설': ('#D3D3D3', 'black'),      # 연한 회색
+        '공포': ('#2F2F2F', 'white'),      # 어두운 회색 (밝은 글자)
+        '미분류': ('#F5F5F5', 'black'),    # 매우 연한 회색
+    }
+    
+    # 장르 수정 창의 장르 목록 (색상별 그룹화)
+    EDIT_GENRE_GROUPS = (
+        ('판타지 계열', ('판타지', '퓨판', '겜판', '현판')),
+        ('로맨스 계열', ('로판', '언정')),
+        ('무협/선협', ('무협', '선협')),
+        ('기타', ('SF', '스포츠', '역사', '밀리터리', '패러디', '현대', '소설', '미분류')),
+    )
+    
+    # 장르 수정 창 버튼 색상 (배경, 글자) - 목록에 없으면 EDIT_GENRE_DEFAULT_COLOR
+    EDIT_GENRE_COLORS = {
+        '무협': ('#FF6B6B', 'white'), '로판': ('#FF69B4', 'black'), '현판': ('#4ECDC4', 'black'),
+        '퓨판': ('#45B7D1', 'black'), '겜판': ('#96CEB4', 'black'), '선협': ('#FFEAA7', 'black'),
+        '역사': ('#DDA0DD', 'black'), 'SF': ('#87CEEB', 'white'), '스포츠': ('#FFA500', 'black'),
+        '밀리터리': ('#556B2F', 'black'), '패러디': ('#DA70D6', 'black'),
+        '언정': ('#F0A0A0', 'black'), '현대': ('#B0C4DE', 'black'), '소설': ('#D3D3D3', 'black'),
+        '판타지': ('#9B59B6', 'black'), '미분류': ('#F5F5F5', 'black'),
+    }
+    EDIT_GENRE_DEFAULT_COLOR = ('#E0E0E0', 'black')
+    
+    # 상세 정보 창의 네이버 검색 출처 설명
+    NAVER_SOURCE_DESCRIPTIONS = {
+        'ridibooks_page': '리디북스 공식 페이지',
+        'ridibooks_meta': '리디북스 메타 태그',
+        'ridibooks_link': '리디북스 장르 링크',
+        'novelpia_page': '노벨피아 공식 페이지',
+        'novelpia_meta': '노벨피아 메타 태그',
+        'novelpia_tag': '노벨피아 태그',
+        'naver_series_page': '네이버시리즈 공식 페이지',
+        'naver_series_meta': '네이버시리즈 메타 태그',
+        'naver_search': '네이버 검색 결과',
+    }
+    
     def __init__(self, root):
         self.root = root
-        self.root.title(f"웹소설 장르 자동 분류기 {get_full_version_string()}")
+        self.root.title(f"웹소설 장르 자동 분류기 {_VERSION_STRING}")
         self.root.geometry("1800x1100")
         
         # 기본 폰트 크기 설정 (메시지박스 포함)
-        import tkinter.font as tkfont
         default_font = tkfont.nametofont("TkDefaultFont")
         default_font.configure(size=13)  # 기본 폰트 크기를 13으로 설정
         
@@ -137,20 +625,100 @@ class GenreClassifierGUI:
         self.results = []
         self.is_processing = False
         self.selected_items = []
+        self._incoming_results = deque()  # 작업 스레드가 넘긴, 아직 추가하지 않은 결과
+        self._pending_rows = []  # 트리뷰에 아직 반영하지 않은 결과 행
+        self._row_values = {}  # 트리뷰 항목 ID → 표시 값 (정렬 시 Tcl 조회 생략)
+        self._row_results = {}  # 트리뷰 항목 ID → 결과 dict (선택 항목의 결과를 검색 없이 찾음)
+        # 통계 패널용 누적 집계 (결과 추가/수정/삭제 시 갱신하므로 매번 전체를 다시 세지 않음)
+        self._genre_counts = Counter()
+        self._method_counts = Counter()
+        self._confidence_sum = 0
+        self._confidence_count = 0
+        self._flush_rows_job = None
+        self._stats_job = None
+        self._stats_rendered = "통계 정보가 여기에 표시됩니다."  # 통계 패널에 마지막으로 그린 문자열
+        self._preview_job = None  # 탭 표시 시 미리보기 갱신 예약
+        self._progress_job = None  # 진행 상황 갱신 예약 (값/문구는 마지막 것만 반영)
+        self._progress_value = None
+        self._progress_text = None
+        self._api_config_manager = None  # 로드한 설정을 캐시하므로 창 단위로 공유
+        self._classify_cache = self._load_classify_cache()  # 캐시 키 → 네이버 조회 분류 결과
+        self._classify_cache_dirty = False
         self.files_renamed = False  # 파일명 변경 완료 플래그
+        self._results_version = 0  # 결과 추가/삭제/수정 시 증가 (미리보기 재구성 여부 판단)
+        self._preview_signature = None  # 마지막으로 미리보기를 만든 (결과 버전, 형식)
         
+        self.setup_styles()
         self.setup_ui()
         
         # API 키 자동 로드
         self.auto_load_api_keys()
     
+    def setup_styles(self):
+        """위젯 스타일 설정 (테마 선택 후 한 번에 구성, 각 패널은 스타일 이름만 참조)"""
+        self.style = style = ttk.Style()
+        
+        # tk.Button 공통 기본값은 옵션 데이터베이스에 한 번만 등록
+        # (위젯별 인자로 넘긴 값이 우선하므로 색상/글꼴이 다른 버튼은 직접 지정)
+        self.root.option_add('*Button.foreground', 'white')
+        self.root.option_add('*Button.font', ('맑은 고딕', 11, 'bold'))
+        self.root.option_add('*Button.relief', 'raised')
+        self.root.option_add('*Button.cursor', 'hand2')
+        
+        # 스타일 설정은 테마별로 저장되므로 테마를 먼저 선택
+        style.theme_use('clam')
+        
+        # 진행 상태바 스타일
+        style.configure('Custom.Horizontal.TProgressbar',
+                       background=self.colors['success'],  # 진행 부분 색상 (초록색)
+                       troughcolor=self.colors['light_bg'],  # 배경 색상
+                       borderwidth=1,
+                       lightcolor=self.colors['success'],
+                       darkcolor=self.colors['success'])
+        
+        # 탭 스타일
+        style.configure('Custom.TNotebook', 
+                       background=self.colors['light_bg'],
+                       borderwidth=2,
+                       relief='solid')
+        
+        style.configure('Custom.TNotebook.Tab',
+                       background=self.colors['tab_inactive'],
+                       foreground=self.colors['dark_text'],
+                       padding=[20, 10],
+                       font=('맑은 고딕', 12, 'bold'))
+        
+        style.map('Custom.TNotebook.Tab',
+                 background=[('selected', self.colors['tab_active']),
+                           ('active', self.colors['info'])],
+                 foreground=[('selected', 'white'),
+                           ('active', 'white')])
+        
+        # 분류 결과 / 미리보기 트리뷰 스타일 (헤더 색상만 다름)
+        for name, heading_bg in (('Result.Treeview', self.colors['primary']),
+                                 ('Preview.Treeview', self.colors['warning'])):
+            style.configure(name,
+                           background=self.colors['tree_bg'],
+                           foreground=self.colors['dark_text'],
+                           fieldbackground=self.colors['tree_bg'],
+                           font=('맑은 고딕', 12))
+            
+            style.configure(f'{name}.Heading',
+                           background=heading_bg,
+                           foreground='white',
+                           font=('맑은 고딕', 13, 'bold'))
+            
+            style.map(name,
+                     background=[('selected', self.colors['tree_select'])],
+                     foreground=[('selected', self.colors['dark_text'])])
+    
     def setup_ui(self):
         """UI 구성 - 좌우 분할"""
         # 상단 타이틀
         title_frame = tk.Frame(self.root, bg=self.colors['primary'], padx=10, pady=15)
         title_frame.pack(fill=tk.X)
         
-        tk.Label(title_frame, text=f"웹소설 장르 자동 분류기 {get_full_version_string()}", 
+        tk.Label(title_frame, text=f"웹소설 장르 자동 분류기 {_VERSION_STRING}", 
                  font=("맑은 고딕", 20, "bold"), 
                  bg=self.colors['primary'], fg='white').pack()
         tk.Label(title_frame, text="파일명 → 제목 추출 → 장르 판정 (리디북스 > 문피아 > 네이버시리즈) → 파일명 변경", 
@@ -189,9 +757,8 @@ class GenreClassifierGUI:
         
         dir_btn = tk.Button(dir_frame, text="📁 디렉토리 선택", 
                            command=self.select_directory,
-                           font=("맑은 고딕", 11, "bold"), width=18,
-                           bg=self.colors['success'], fg='white',
-                           relief='raised', bd=2, cursor='hand2')
+                           width=18,
+                           bg=self.colors['success'], bd=2)
         dir_btn.pack(pady=5)
         
         # 2. 분류 옵션
@@ -212,42 +779,23 @@ class GenreClassifierGUI:
         checkbox_container.pack(fill=tk.X, pady=5, padx=5)
         
         # 커스텀 체크박스 스타일 (버튼 형태)
-        def update_naver_button():
-            if self.use_naver_var.get():
-                naver_check.config(
-                    text="✅ 네이버 검색 사용 (V3 - 리디북스 우선)",
-                    bg=self.colors['success'],
-                    fg='white',
-                    relief='raised'
-                )
-            else:
-                naver_check.config(
-                    text="☐ 네이버 검색 사용 (V3 - 리디북스 우선)",
-                    bg=self.colors['light_bg'],
-                    fg=self.colors['dark_text'],
-                    relief='sunken'
-                )
-        
-        def toggle_naver_and_update():
-            self.toggle_naver_options()
-            update_naver_button()
-        
         naver_check = tk.Button(checkbox_container, 
                                text="✅ 네이버 검색 사용 (V3 - 리디북스 우선)",
-                               command=lambda: [self.use_naver_var.set(not self.use_naver_var.get()), toggle_naver_and_update()],
-                               font=("맑은 고딕", 11, "bold"),
                                bg=self.colors['success'],  # 기본값: 체크됨
-                               fg='white',
-                               relief='raised',
                                bd=2,
-                               cursor='hand2',
                                anchor='w',
                                padx=10,
                                pady=5)
         naver_check.pack(fill=tk.X, pady=3, padx=5)
         
-        # 초기 상태 설정
-        update_naver_button()
+        self._naver_toggle = _ToggleButton(
+            naver_check, self.use_naver_var,
+            on_cfg={'text': "✅ 네이버 검색 사용 (V3 - 리디북스 우선)",
+                    'bg': self.colors['success'], 'fg': 'white', 'relief': 'raised'},
+            off_cfg={'text': "☐ 네이버 검색 사용 (V3 - 리디북스 우선)",
+                     'bg': self.colors['light_bg'], 'fg': self.colors['dark_text'], 'relief': 'sunken'},
+            extra=self.toggle_naver_options
+        )
         
         info_label1 = tk.Label(naver_frame, text="📊 신뢰도 85-95%, 약 3초/건, 제목 검증 포함", 
                               font=("맑은 고딕", 9), 
@@ -266,16 +814,9 @@ class GenreClassifierGUI:
         api_frame = tk.Frame(api_outer_frame, bg='white', relief='flat')
         api_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
         
-        # API 키가 있으면 자동으로 API 사용 활성화 (PyInstaller 환경 고려)
-        if getattr(sys, 'frozen', False):
-            # PyInstaller로 빌드된 실행 파일
-            application_path = os.path.dirname(sys.executable)
-        else:
-            # 일반 Python 스크립트
-            application_path = os.path.dirname(os.path.abspath(__file__))
-        
-        api_config_path = os.path.join(application_path, 'naver_api_config.json')
-        api_config_exists = os.path.exists(api_config_path)
+        # API 키가 있으면 자동으로 API 사용 활성화
+        # (설정 파일은 여기서 한 번만 읽고, auto_load_api_keys는 매니저 캐시를 사용)
+        api_config_exists = self._get_api_config_manager().load_config() is not None
         self.use_naver_api_var = tk.BooleanVar(value=api_config_exists)
         
         # API 체크박스 컨테이너
@@ -283,42 +824,25 @@ class GenreClassifierGUI:
         api_checkbox_container.pack(fill=tk.X, pady=3, padx=5)
         
         # API 커스텀 체크박스 스타일
-        def update_api_button():
-            if self.use_naver_api_var.get():
-                api_check.config(
-                    text="✅ 네이버 검색 API 사용 (안정적, API 키 필요)",
-                    bg=self.colors['primary'],
-                    fg='white',
-                    relief='raised'
-                )
-            else:
-                api_check.config(
-                    text="☐ 네이버 검색 API 사용 (안정적, API 키 필요)",
-                    bg='white',
-                    fg=self.colors['warning'],
-                    relief='sunken'
-                )
-        
-        def toggle_api_and_update():
-            self.toggle_api_key_entry()
-            update_api_button()
-        
         api_check = tk.Button(api_checkbox_container,
                              text="☐ 네이버 검색 API 사용 (안정적, API 키 필요)",
-                             command=lambda: [self.use_naver_api_var.set(not self.use_naver_api_var.get()), toggle_api_and_update()],
-                             font=("맑은 고딕", 11, "bold"),
                              bg='white',  # 기본값: 체크 안됨
                              fg=self.colors['warning'],
                              relief='sunken',
                              bd=2,
-                             cursor='hand2',
                              anchor='w',
                              padx=10,
                              pady=5)
         api_check.pack(fill=tk.X, pady=2, padx=5)
         
-        # 초기 상태 설정
-        update_api_button()
+        self._api_toggle = _ToggleButton(
+            api_check, self.use_naver_api_var,
+            on_cfg={'text': "✅ 네이버 검색 API 사용 (안정적, API 키 필요)",
+                    'bg': self.colors['primary'], 'fg': 'white', 'relief': 'raised'},
+            off_cfg={'text': "☐ 네이버 검색 API 사용 (안정적, API 키 필요)",
+                     'bg': 'white', 'fg': self.colors['warning'], 'relief': 'sunken'},
+            extra=self.toggle_api_key_entry
+        )
         
         # API 키 입력 프레임
         self.api_key_frame = ttk.Frame(api_frame)
@@ -343,19 +867,20 @@ class GenreClassifierGUI:
         
         save_api_btn = tk.Button(api_button_frame, text="💾 저장", command=self.save_api_keys,
                                 font=("맑은 고딕", 9, "bold"), width=8,
-                                bg=self.colors['primary'], fg='white',
-                                relief='raised', bd=1, cursor='hand2')
+                                bg=self.colors['primary'], bd=1)
         save_api_btn.pack(side=tk.LEFT, padx=2)
         
         load_api_btn = tk.Button(api_button_frame, text="📂 불러오기", command=self.load_api_keys,
                                 font=("맑은 고딕", 9, "bold"), width=10,
-                                bg=self.colors['info'], fg='white',
-                                relief='raised', bd=1, cursor='hand2')
+                                bg=self.colors['info'], bd=1)
         load_api_btn.pack(side=tk.LEFT, padx=2)
         
         ttk.Label(self.api_key_frame, text="※ API 키는 로컬에 암호화되어 저장됩니다", 
                  font=("맑은 고딕", 9), foreground=self.colors['gray']).grid(row=3, column=0, columnspan=2, pady=2)
         
+        # API 사용 여부에 따라 활성화/비활성화할 위젯 (위젯 구성은 이후 바뀌지 않음)
+        self._api_key_widgets = (self.api_client_id_entry, self.api_client_secret_entry)
+        
         # 초기 상태: API 키 입력 비활성화
         self.toggle_api_key_entry()
         
@@ -376,7 +901,9 @@ class GenreClassifierGUI:
         for ext in extensions:
             var = tk.BooleanVar(value=True)
             self.ext_vars[ext] = var
-            ttk.Checkbutton(ext_row, text=ext, variable=var).pack(side=tk.LEFT, padx=5, pady=2)
+            ttk.Checkbutton(ext_row, text=ext, variable=var,
+                            command=self._refresh_enabled_extensions).pack(side=tk.LEFT, padx=5, pady=2)
+        self._refresh_enabled_extensions()
         
         # 3. 실행 버튼 (1줄 배치)
         button_frame = ttk.LabelFrame(parent, text="3. 실행", padding="10")
@@ -396,9 +923,7 @@ class GenreClassifierGUI:
         
         self.start_button = tk.Button(start_style_frame, text="▶ 시작", 
                                        command=self.start_classification,
-                                       bg=self.colors['success'], fg='white',
-                                       font=("맑은 고딕", 11, "bold"),
-                                       relief=tk.FLAT, cursor='hand2')
+                                       bg=self.colors['success'], relief=tk.FLAT)
         self.start_button.pack(fill=tk.BOTH, expand=True)
         
         # 중지 버튼 (빨간색)
@@ -407,17 +932,13 @@ class GenreClassifierGUI:
         
         self.stop_button = tk.Button(stop_style_frame, text="■ 중지", 
                                       command=self.stop_classification,
-                                      bg=self.colors['danger'], fg='white',
-                                      font=("맑은 고딕", 11, "bold"),
-                                      relief=tk.FLAT, cursor='hand2',
-                                      state=tk.DISABLED)
+                                      bg=self.colors['danger'], relief=tk.FLAT, state=tk.DISABLED)
         self.stop_button.pack(fill=tk.BOTH, expand=True)
         
         # 결과 저장 버튼
         save_results_btn = tk.Button(button_container, text="💾 저장", command=self.save_results,
                                     font=("맑은 고딕", 10, "bold"),
-                                    bg=self.colors['success'], fg='white',
-                                    relief='raised', bd=2, cursor='hand2')
+                                    bg=self.colors['success'], bd=2)
         save_results_btn.grid(row=0, column=2, sticky='ew', padx=2)
         
         # 초기화 버튼
@@ -428,18 +949,11 @@ class GenreClassifierGUI:
         progress_frame = ttk.LabelFrame(parent, text="4. 진행 상황", padding="10")
         progress_frame.pack(fill=tk.X, pady=5)
         
-        self.progress_label = ttk.Label(progress_frame, text="대기 중...", wraplength=350)
+        # 고정 너비 (분류 중 자주 바뀌므로 줄바꿈 계산/레이아웃 재조정을 피하고 긴 문구는 잘라서 표시)
+        self.progress_label = ttk.Label(progress_frame, text="대기 중...", 
+                                        width=self.PROGRESS_LABEL_WIDTH, anchor='w')
         self.progress_label.pack(pady=2)
         
-        # 진행 상태바 스타일 설정
-        style = ttk.Style()
-        style.configure('Custom.Horizontal.TProgressbar',
-                       background=self.colors['success'],  # 진행 부분 색상 (초록색)
-                       troughcolor=self.colors['light_bg'],  # 배경 색상
-                       borderwidth=1,
-                       lightcolor=self.colors['success'],
-                       darkcolor=self.colors['success'])
-        
         self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', 
                                            style='Custom.Horizontal.TProgressbar')
         self.progress_bar.pack(fill=tk.X, pady=5)
@@ -448,47 +962,17 @@ class GenreClassifierGUI:
         stats_frame = ttk.LabelFrame(parent, text="5. 통계", padding="10")
         stats_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        # 스크롤바 추가
-        stats_scroll_frame = ttk.Frame(stats_frame)
-        stats_scroll_frame.pack(fill=tk.BOTH, expand=True)
-        
-        stats_scrollbar = ttk.Scrollbar(stats_scroll_frame)
-        stats_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # 스크롤 가능한 통계 텍스트 (통계 창과 같은 ScrolledText 사용)
+        self.stats_text = scrolledtext.ScrolledText(stats_frame, height=12, wrap=tk.WORD, 
+                                                    font=("맑은 고딕", 11),
+                                                    bg=self.colors['light_bg'])
+        self.stats_text.pack(fill=tk.BOTH, expand=True)
         
-        self.stats_text = tk.Text(stats_scroll_frame, height=12, wrap=tk.WORD, 
-                                  font=("맑은 고딕", 11),
-                                  bg=self.colors['light_bg'],
-                                  yscrollcommand=stats_scrollbar.set)
-        self.stats_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        stats_scrollbar.config(command=self.stats_text.yview)
-        
-        self.stats_text.insert('1.0', "통계 정보가 여기에 표시됩니다.")
+        self.stats_text.insert('1.0', self._stats_rendered)
         self.stats_text.config(state=tk.DISABLED)
     
     def setup_right_panel(self, parent):
         """오른쪽 패널 구성"""
-        # 탭 스타일 설정
-        style = ttk.Style()
-        
-        # 탭 스타일 커스터마이징
-        style.theme_use('clam')
-        style.configure('Custom.TNotebook', 
-                       background=self.colors['light_bg'],
-                       borderwidth=2,
-                       relief='solid')
-        
-        style.configure('Custom.TNotebook.Tab',
-                       background=self.colors['tab_inactive'],
-                       foreground=self.colors['dark_text'],
-                       padding=[20, 10],
-                       font=('맑은 고딕', 12, 'bold'))
-        
-        style.map('Custom.TNotebook.Tab',
-                 background=[('selected', self.colors['tab_active']),
-                           ('active', self.colors['info'])],
-                 foreground=[('selected', 'white'),
-                           ('active', 'white')])
-        
         # 탭 생성
         self.notebook = ttk.Notebook(parent, style='Custom.TNotebook')
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -513,57 +997,30 @@ class GenreClassifierGUI:
         btn_frame.pack(fill=tk.X, pady=5)
         
         detail_btn = tk.Button(btn_frame, text="🔍 상세보기", command=self.show_detail,
-                              font=("맑은 고딕", 11, "bold"), 
-                              bg=self.colors['info'], fg='white',
-                              relief='raised', bd=1, cursor='hand2')
+                              bg=self.colors['info'], bd=1)
         detail_btn.pack(side=tk.LEFT, padx=2)
         
         edit_btn = tk.Button(btn_frame, text="✏️ 장르 수정", command=self.edit_genre,
-                            font=("맑은 고딕", 11, "bold"),
-                            bg=self.colors['warning'], fg='white',
-                            relief='raised', bd=1, cursor='hand2')
+                            bg=self.colors['warning'], bd=1)
         edit_btn.pack(side=tk.LEFT, padx=2)
         
         filename_btn = tk.Button(btn_frame, text="📝 파일명 수정", command=self.edit_filename,
-                                font=("맑은 고딕", 11, "bold"),
-                                bg='#9B59B6', fg='white',  # 보라색
-                                relief='raised', bd=1, cursor='hand2')
+                                bg='#9B59B6', bd=1)  # 보라색
         filename_btn.pack(side=tk.LEFT, padx=2)
         
         stats_btn = tk.Button(btn_frame, text="📊 통계", command=self.show_statistics,
-                             font=("맑은 고딕", 11, "bold"),
-                             bg=self.colors['primary'], fg='white',
-                             relief='raised', bd=1, cursor='hand2')
+                             bg=self.colors['primary'], bd=1)
         stats_btn.pack(side=tk.LEFT, padx=2)
         
         delete_btn = tk.Button(btn_frame, text="🗑️ 선택 삭제", command=self.delete_selected,
-                              font=("맑은 고딕", 11, "bold"),
-                              bg=self.colors['danger'], fg='white',
-                              relief='raised', bd=1, cursor='hand2')
+                              bg=self.colors['danger'], bd=1)
         delete_btn.pack(side=tk.LEFT, padx=2)
         
         # 결과 트리뷰 프레임 (배경색 적용)
         tree_frame = tk.Frame(parent, bg=self.colors['tree_bg'], relief='sunken', bd=2)
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # 트리뷰 스타일 설정
-        style = ttk.Style()
-        style.configure('Result.Treeview',
-                       background=self.colors['tree_bg'],
-                       foreground=self.colors['dark_text'],
-                       fieldbackground=self.colors['tree_bg'],
-                       font=('맑은 고딕', 12))
-        
-        style.configure('Result.Treeview.Heading',
-                       background=self.colors['primary'],
-                       foreground='white',
-                       font=('맑은 고딕', 13, 'bold'))
-        
-        style.map('Result.Treeview',
-                 background=[('selected', self.colors['tree_select'])],
-                 foreground=[('selected', self.colors['dark_text'])])
-        
-        columns = ('파일명', '제목', '장르', '신뢰도', '출처')
+        columns = self.RESULT_COLUMNS
         self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', 
                                 selectmode='extended', style='Result.Treeview')
         
@@ -604,168 +1061,14 @@ class GenreClassifierGUI:
             return "-"
         
         # result_details에서 네이버 검색 결과의 source 정보 추출
+        # (source는 네이버 관련 method에서만 쓰이므로 나머지는 None으로 두어 캐시 키를 줄임)
         platform_source = None
-        if result_details and isinstance(result_details, dict):
+        if method in _NAVER_DYNAMIC_METHODS and result_details and isinstance(result_details, dict):
             naver_result = result_details.get('naver_result')
             if naver_result and isinstance(naver_result, dict):
                 platform_source = naver_result.get('source', '')
         
-        # 방법별 출처 표시 (플랫폼 이름 우선)
-        method_mapping = {
-            # 네이버 검색 기반 - 플랫폼 이름 표시
-            'naver_ridibooks_meta_priority': '리디북스',
-            'naver_ridibooks_priority': '리디북스',
-            'naver_novelpia_priority': '노벨피아',
-            'naver_novelpia_hashtag': '노벨피아',
-            'naver_novelpia_hashtag_analysis': '노벨피아',
-            'naver_munpia_priority': '문피아',
-            'naver_naver_series_priority': '네이버시리즈',
-            'naver_kakao_priority': '카카오페이지',
-            
-            # 재매핑 - 플랫폼+키워드
-            'naverseries_keyword_refined': '키워드+네이버시리즈',
-            'naverseriesports_refined': '키워드+네이버시리즈',
-            'naverseries_sports_refined': '키워드+네이버시리즈',
-            'kakaopage_keyword_refined': '키워드+카카오페이지',
-            'kakaopagesports_refined': '키워드+카카오페이지',
-            'kakaopage_sports_refined': '키워드+카카오페이지',
-            'ridibooks_history_refined': '키워드+리디북스',
-            'ridibookssports_refined': '키워드+리디북스',
-            'ridibooks_sports_refined': '키워드+리디북스',
-            'ridibooksgame_refined': '키워드+리디북스',
-            'ridibooks_game_refined': '키워드+리디북스',
-            
-            # 키워드 기반
-            'keyword_only': '키워드',
-            'keyword_high_confidence': '키워드',
-            'keyword_higher_confidence': '키워드',
-            
-            # 특수 케이스
-            'special_case': '키워드',
-            'compound_pattern': '키워드',
-            'manual_edit': '사용자',
-            'author_genre_db': '저자DB',
-            'author_genre_db_fallback': '저자DB',
-            'title_keyword_analysis': '키워드',
-            
-            # 통합 결과 - platform_source 확인 필요
-            'both_agree': None,  # 동적 처리
-            'naver_high_confidence': None,  # 동적 처리
-            'naver_higher_confidence': None,  # 동적 처리
-            'naver_only': None,  # 동적 처리
-            
-            # 신뢰도 부족
-            'low_confidence': '키워드'
-        }
-        
-        # 매핑된 값이 있으면 사용 (None이 아닌 경우)
-        if method in method_mapping and method_mapping[method] is not None:
-            return method_mapping[method]
-        
-        # 네이버 관련 method는 platform_source로 플랫폼 이름 추출
-        if method in ['naver_only', 'naver_high_confidence', 'naver_higher_confidence', 'both_agree']:
-            if platform_source:
-                # platform_source에서 플랫폼 이름 추출 (한글 포함)
-                platform_source_lower = platform_source.lower()
-                if 'ridibooks' in platform_source_lower or '리디북스' in platform_source:
-                    platform_name = '리디북스'
-                elif 'novelpia' in platform_source_lower or '노벨피아' in platform_source:
-                    platform_name = '노벨피아'
-                elif 'munpia' in platform_source_lower or '문피아' in platform_source:
-                    platform_name = '문피아'
-                elif 'naver' in platform_source_lower or '네이버시리즈' in platform_source:
-                    platform_name = '네이버시리즈'
-                elif 'kakao' in platform_source_lower or '카카오' in platform_source:
-                    platform_name = '카카오페이지'
-                elif 'novelnet' in platform_source_lower or '소설넷' in platform_source:
-                    platform_name = '소설넷'
-                elif 'mrblue' in platform_source_lower or '미스터블루' in platform_source:
-                    platform_name = '미스터블루'
-                elif 'webtoonguide' in platform_source_lower or '웹툰가이드' in platform_source:
-                    platform_name = '웹툰가이드'
-                elif 'yes24' in platform_source_lower or 'YES24' in platform_source:
-                    platform_name = 'YES24'
-                elif 'kyobo' in platform_source_lower or '교보문고' in platform_source:
-                    platform_name = '교보문고'
-                elif 'aladin' in platform_source_lower or '알라딘' in platform_source:
-                    platform_name = '알라딘'
-                elif 'joar' in platform_source_lower or '조아라' in platform_source:
-                    platform_name = '조아라'
-                else:
-                    platform_name = '네이버'
-                
-                # both_agree는 키워드+플랫폼
-                if method == 'both_agree':
-                    return f'키워드+{platform_name}'
-                else:
-                    return platform_name
-            else:
-                # platform_source가 없으면 기본값
-                if method == 'both_agree':
-                    return '키워드+네이버'
-                else:
-                    return '네이버'
-        
-        # 매핑되지 않은 경우 플랫폼 이름 추출 (한글 포함)
-        method_lower = method.lower()
-        
-        # 플랫폼별 우선순위로 확인 (한글 이름도 체크)
-        if 'ridibooks' in method_lower or 'ridi' in method_lower or '리디북스' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+리디북스'
-            return '리디북스'
-        elif 'novelpia' in method_lower or '노벨피아' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+노벨피아'
-            return '노벨피아'
-        elif 'munpia' in method_lower or '문피아' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+문피아'
-            return '문피아'
-        elif ('naver' in method_lower and 'series' in method_lower) or '네이버시리즈' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+네이버시리즈'
-            return '네이버시리즈'
-        elif 'kakao' in method_lower or '카카오' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+카카오페이지'
-            return '카카오페이지'
-        elif 'novelnet' in method_lower or '소설넷' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+소설넷'
-            return '소설넷'
-        elif 'mrblue' in method_lower or '미스터블루' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+미스터블루'
-            return '미스터블루'
-        elif 'webtoonguide' in method_lower or '웹툰가이드' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+웹툰가이드'
-            return '웹툰가이드'
-        elif 'yes24' in method_lower:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+YES24'
-            return 'YES24'
-        elif 'kyobo' in method_lower or '교보문고' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+교보문고'
-            return '교보문고'
-        elif 'aladin' in method_lower or '알라딘' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+알라딘'
-            return '알라딘'
-        elif 'joar' in method_lower or '조아라' in method:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+조아라'
-            return '조아라'
-        elif 'naver' in method_lower:
-            if 'keyword' in method_lower or 'refined' in method_lower:
-                return '키워드+네이버'
-            return '네이버'
-        elif 'keyword' in method_lower:
-            return '키워드'
-        else:
-            return method[:8]  # 최대 8글자로 제한
+        return _simplify_method_cached(method, platform_source)
     
     def _add_section_header(self, parent, title, color):
         """섹션 헤더 추가"""
@@ -798,27 +1101,8 @@ class GenreClassifierGUI:
     
     def setup_genre_colors(self):
         """장르별 색상 태그 설정"""
-        genre_colors = {
-            '무협': '#FF6B6B',      # 빨간색 계열
-            '로판': '#FF69B4',      # 핑크색
-            '현판': '#4ECDC4',      # 청록색
-            '퓨판': '#45B7D1',      # 파란색
-            '겜판': '#96CEB4',      # 연두색
-            '선협': '#FFEAA7',      # 노란색
-            '역사': '#DDA0DD',      # 자주색
-            'SF': '#87CEEB',        # 하늘색
-            '스포츠': '#FFA500',    # 주황색
-            '밀리터리': '#556B2F',  # 올리브 그린
-            '패러디': '#DA70D6',    # 오키드
-            '언정': '#F0A0A0',      # 연한 빨간색
-            '현대': '#B0C4DE',      # 연한 파란색
-            '소설': '#D3D3D3',      # 연한 회색
-            '공포': '#2F2F2F',      # 어두운 회색
-            '미분류': '#F5F5F5'     # 매우 연한 회색
-        }
-        
-        for genre, color in genre_colors.items():
-            self.tree.tag_configure(genre, background=color, foreground='white' if genre == '공포' else 'black')
+        for genre, (background, foreground) in self.GENRE_TAG_COLORS.items():
+            self.tree.tag_configure(genre, background=background, foreground=foreground)
     
     def setup_rename_tab(self, parent):
         """파일명 변경 탭"""
@@ -854,23 +1138,6 @@ class GenreClassifierGUI:
         preview_frame = ttk.LabelFrame(preview_outer, text="📋 미리보기 (체크박스로 변경할 파일 선택)", padding="10")
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # 미리보기 트리뷰 스타일 설정
-        style = ttk.Style()
-        style.configure('Preview.Treeview',
-                       background=self.colors['tree_bg'],
-                       foreground=self.colors['dark_text'],
-                       fieldbackground=self.colors['tree_bg'],
-                       font=('맑은 고딕', 12))
-        
-        style.configure('Preview.Treeview.Heading',
-                       background=self.colors['warning'],
-                       foreground='white',
-                       font=('맑은 고딕', 13, 'bold'))
-        
-        style.map('Preview.Treeview',
-                 background=[('selected', self.colors['tree_select'])],
-                 foreground=[('selected', self.colors['dark_text'])])
-        
         # 미리보기 리스트 (체크박스 추가)
         preview_columns = ('선택', '원본', '변경후')
         self.preview_tree = ttk.Treeview(preview_frame, columns=preview_columns, 
@@ -906,43 +1173,51 @@ class GenreClassifierGUI:
         
         select_all_btn = tk.Button(btn_frame, text="☑️ 전체 선택", command=self.select_all_preview,
                                    font=("맑은 고딕", 12, "bold"),
-                                   bg=self.colors['success'], fg='white',
-                                   relief='raised', bd=1, cursor='hand2')
+                                   bg=self.colors['success'], bd=1)
         select_all_btn.pack(side=tk.LEFT, padx=2)
         
         deselect_all_btn = tk.Button(btn_frame, text="☐ 전체 해제", command=self.deselect_all_preview,
                                     font=("맑은 고딕", 12, "bold"),
-                                    bg=self.colors['gray'], fg='white',
-                                    relief='raised', bd=1, cursor='hand2')
+                                    bg=self.colors['gray'], bd=1)
         deselect_all_btn.pack(side=tk.LEFT, padx=2)
         
         refresh_btn = tk.Button(btn_frame, text="🔄 미리보기 새로고침", command=self.update_rename_preview,
                                font=("맑은 고딕", 12, "bold"),
-                               bg=self.colors['info'], fg='white',
-                               relief='raised', bd=1, cursor='hand2')
+                               bg=self.colors['info'], bd=1)
         refresh_btn.pack(side=tk.LEFT, padx=2)
         
         execute_btn = tk.Button(btn_frame, text="✏️ 파일명 변경 실행", command=self.execute_rename,
                                font=("맑은 고딕", 12, "bold"),
-                               bg=self.colors['warning'], fg='white',
-                               relief='raised', bd=1, cursor='hand2')
+                               bg=self.colors['warning'], bd=1)
         execute_btn.pack(side=tk.LEFT, padx=2)
         
         restore_btn = tk.Button(btn_frame, text="↩️ 원래대로 복구", command=self.restore_filenames,
                                font=("맑은 고딕", 12, "bold"),
-                               bg=self.colors['danger'], fg='white',
-                               relief='raised', bd=1, cursor='hand2')
+                               bg=self.colors['danger'], bd=1)
         restore_btn.pack(side=tk.LEFT, padx=2)
         
         # 탭이 표시될 때 자동으로 미리보기 업데이트 (파일명 변경 완료 시 제외)
         parent.bind('<Visibility>', lambda e: self._on_rename_tab_visible())
     
     def _on_rename_tab_visible(self):
-        """파일명 변경 탭이 보일 때 처리"""
-        if not self.files_renamed:
-            # 파일명 변경이 완료되지 않았으면 미리보기 업데이트
+        """
+        파일명 변경 탭이 보일 때 처리
+        
+        탭 전환/창 가림 해제 시 <Visibility>가 연달아 발생하므로
+        마지막 이벤트 후 PREVIEW_REFRESH_MS가 지나면 한 번만 미리보기를 갱신합니다.
+        """
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(self.PREVIEW_REFRESH_MS, self._refresh_visible_rename_preview)
+    
+    def _refresh_visible_rename_preview(self):
+        """예약된 미리보기 갱신 실행 (결과와 형식이 마지막 미리보기와 같으면 그대로 둠)"""
+        self._preview_job = None
+        if self.files_renamed:
+            # 파일명 변경이 완료되었으면 미리보기 업데이트 안 함 (빈 상태 유지)
+            return
+        if self._preview_signature != (self._results_version, self.rename_format_var.get()):
             self.update_rename_preview()
-        # 파일명 변경이 완료되었으면 미리보기 업데이트 안 함 (빈 상태 유지)
     
     def toggle_naver_options(self):
         """네이버 검색 옵션 토글"""
@@ -952,25 +1227,17 @@ class GenreClassifierGUI:
             self.toggle_api_key_entry()
     
     def toggle_api_key_entry(self):
-        """API 키 입력 필드 활성화/비활성화"""
-        if self.use_naver_api_var.get() and self.use_naver_var.get():
-            # API 사용 시 입력 필드 활성화
-            for widget in self.api_key_frame.winfo_children():
-                if isinstance(widget, (ttk.Entry, ttk.Button)):
-                    widget.config(state='normal')
-                elif isinstance(widget, ttk.Frame):
-                    for btn in widget.winfo_children():
-                        if isinstance(btn, ttk.Button):
-                            btn.config(state='normal')
-        else:
-            # API 미사용 시 입력 필드 비활성화
-            for widget in self.api_key_frame.winfo_children():
-                if isinstance(widget, (ttk.Entry, ttk.Button)):
-                    widget.config(state='disabled')
-                elif isinstance(widget, ttk.Frame):
-                    for btn in widget.winfo_children():
-                        if isinstance(btn, ttk.Button):
-                            btn.config(state='disabled')
+        """API 키 입력 필드 활성화/비활성화 (API 사용 시에만 활성화)"""
+        state = 'normal' if self.use_naver_api_var.get() and self.use_naver_var.get() else 'disabled'
+        for widget in self._api_key_widgets:
+            widget.config(state=state)
+    
+    def _get_api_config_manager(self):
+        """API 설정 관리자 (최초 호출 시 생성)"""
+        if self._api_config_manager is None:
+            from modules.classifier.api_config_manager import APIConfigManager
+            self._api_config_manager = APIConfigManager()
+        return self._api_config_manager
     
     def save_api_keys(self):
         """API 키 저장 (간단한 암호화)"""
@@ -982,10 +1249,8 @@ class GenreClassifierGUI:
             return
         
         try:
-            from modules.classifier.api_config_manager import APIConfigManager
-            
             # APIConfigManager로 암호화 저장
-            manager = APIConfigManager()
+            manager = self._get_api_config_manager()
             success = manager.save_config(client_id, client_secret, encrypt=True)
             
             if success:
@@ -999,10 +1264,8 @@ class GenreClassifierGUI:
     def auto_load_api_keys(self):
         """저장된 API 키 자동 로드 (메시지 없이)"""
         try:
-            from modules.classifier.api_config_manager import APIConfigManager
-            
             # APIConfigManager로 로드 (자동 복호화)
-            manager = APIConfigManager()
+            manager = self._get_api_config_manager()
             config = manager.load_config()
             
             if config:
@@ -1021,10 +1284,8 @@ class GenreClassifierGUI:
     def load_api_keys(self):
         """API 키 불러오기 (버튼 클릭 시)"""
         try:
-            from modules.classifier.api_config_manager import APIConfigManager
-            
             # APIConfigManager로 로드 (자동 복호화)
-            manager = APIConfigManager()
+            manager = self._get_api_config_manager()
             config = manager.load_config()
             
             if not config:
@@ -1041,6 +1302,32 @@ class GenreClassifierGUI:
         except Exception as e:
             messagebox.showerror("오류", f"API 키 불러오기 실패: {str(e)}")
     
+    def _refresh_enabled_extensions(self):
+        """확장자 체크박스 변경 시 허용 확장자 튜플 갱신"""
+        self._enabled_exts = tuple(ext for ext, var in self.ext_vars.items() if var.get())
+    
+    def _enabled_extensions(self):
+        """체크된 확장자 튜플 (str.endswith에 바로 전달, 체크박스 변경 시에만 다시 계산)"""
+        return self._enabled_exts
+    
+    @staticmethod
+    def _scan_directory(directory, extensions=None):
+        """
+        디렉토리의 파일 이름 목록 (하위 폴더 제외)
+        
+        os.scandir는 디렉토리 항목과 파일 종류를 함께 돌려주므로
+        파일마다 os.path.isfile(stat)을 다시 호출하지 않습니다.
+        
+        Args:
+            directory: 검색할 디렉토리
+            extensions: 허용 확장자 튜플 (None이면 모든 파일)
+        """
+        with os.scandir(directory) as entries:
+            return [
+                entry.name for entry in entries
+                if entry.is_file() and (extensions is None or entry.name.endswith(extensions))
+            ]
+    
     def select_directory(self):
         """디렉토리 선택"""
         directory = filedialog.askdirectory(title="웹소설 파일이 있는 디렉토리 선택")
@@ -1051,9 +1338,7 @@ class GenreClassifierGUI:
                                  foreground="black")
             
             # 파일 개수 확인
-            extensions = [ext for ext, var in self.ext_vars.items() if var.get()]
-            files = [f for f in os.listdir(directory) 
-                    if any(f.endswith(ext) for ext in extensions)]
+            files = self._scan_directory(directory, self._enabled_extensions())
             
             messagebox.showinfo("디렉토리 선택", 
                               f"{len(files)}개의 파일을 찾았습니다.")
@@ -1072,9 +1357,7 @@ class GenreClassifierGUI:
         self.files_renamed = False
         
         # 파일 목록 가져오기
-        extensions = [ext for ext, var in self.ext_vars.items() if var.get()]
-        files = [f for f in os.listdir(self.current_directory) 
-                if any(f.endswith(ext) for ext in extensions)]
+        files = self._scan_directory(self.current_directory, self._enabled_extensions())
         
         if not files:
             messagebox.showwarning("경고", "선택한 확장자의 파일이 없습니다.")
@@ -1083,7 +1366,9 @@ class GenreClassifierGUI:
         # 확인
         use_naver = self.use_naver_var.get()
         use_naver_api = self.use_naver_api_var.get()
-        estimated_time = len(files) * (3 if use_naver else 0.1)
+        # 네이버 조회는 작업 스레드 수만큼 파일을 동시에 처리하므로 그만큼 나눠서 추정
+        batches = -(-len(files) // self._classify_workers(use_naver, use_naver_api))
+        estimated_time = batches * 3 if use_naver else len(files) * 0.1
         
         msg = f"{len(files)}개 파일을 분류합니다.\n"
         if use_naver:
@@ -1121,6 +1406,7 @@ class GenreClassifierGUI:
         """파일 처리 (별도 스레드)"""
         use_naver = self.use_naver_var.get()
         use_naver_api = self.use_naver_api_var.get()
+        directory = self.current_directory
         total = len(files)
         
         # API 키 가져오기
@@ -1140,80 +1426,295 @@ class GenreClassifierGUI:
                               "API 키가 입력되지 않아 웹 크롤링 방식을 사용합니다.")
                 use_naver_api = False
         
-        for i, filename in enumerate(files):
-            if not self.is_processing:
-                break
-            
-            # 진행 상황 업데이트
-            self.root.after(0, self.update_progress, i + 1, total, filename)
-            
-            # 분류 실행
-            filepath = os.path.join(self.current_directory, filename)
-            
-            # FilenameGenreClassifier가 내부적으로 HybridClassifier를 사용하고
-            # HybridClassifier가 NaverGenreExtractorV3를 사용하므로
-            # use_naver 옵션과 API 설정을 전달
-            result_data = self.classifier.classify_file(
-                filename, 
-                use_naver=use_naver,
-                naver_api_config=naver_api_config
+        # 분류 실행
+        # FilenameGenreClassifier가 내부적으로 HybridClassifier를 사용하고
+        # HybridClassifier가 NaverGenreExtractorV3를 사용하므로
+        # use_naver 옵션과 API 설정을 전달
+        # 파일별 분류는 대부분 네트워크 대기이므로 여러 파일을 동시에 조회하고,
+        # 결과는 파일 순서대로 화면에 반영
+        # 네이버 조회 결과는 캐시에 있으면 다시 조회하지 않음 (키워드 분류만 할 때는 캐시 미사용)
+        # 캐시 키는 파일 경로/크기/수정 시각 + 조회 방식 (API는 Client ID별로 구분)
+        cache = self._classify_cache if use_naver else {}
+        if use_naver:
+            if naver_api_config:
+                client_hash = hashlib.sha1(naver_api_config['client_id'].encode('utf-8')).hexdigest()[:12]
+                mode = f"api:{client_hash}"
+            else:
+                mode = "crawl"
+            identities = [self._file_identity(os.path.join(directory, filename)) for filename in files]
+            keys = [f"{identity}|{mode}" if identity else None for identity in identities]
+        else:
+            keys = [None] * total
+        
+        workers = self._classify_workers(use_naver, naver_api_config is not None)
+        
+        # 여러 파일을 동시에 분류하면 파일별 로그를 모았다가 파일 순서대로 한 덩어리씩 기록
+        output = None
+        if workers > 1 and sys.stdout is not None:
+            output = ThreadCapturedOutput(sys.stdout)
+            sys.stdout = output
+        
+        def classify(filename):
+            if output is None:
+                return self.classifier.classify_file(
+                    filename, use_naver=use_naver, naver_api_config=naver_api_config
+                ), ''
+            return output.run(
+                self.classifier.classify_file,
+                filename, use_naver=use_naver, naver_api_config=naver_api_config
             )
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                None if key in cache else executor.submit(classify, filename)
+                for filename, key in zip(files, keys)
+            ]
             
-            result = {
-                'filename': filename,
-                'title': result_data.get('title', filename),
-                'genre': result_data['genre'],
-                'confidence': result_data['confidence'],
-                'method': result_data['method'],
-                'details': result_data.get('details', {})
-            }
-            
-            # 결과 추가
-            self.root.after(0, self.add_result, result)
-            
-            # 진행률 업데이트
-            progress = (i + 1) / total * 100
-            self.root.after(0, self.progress_bar.config, {'value': progress})
+            try:
+                for i, (filename, key, future) in enumerate(zip(files, keys, futures)):
+                    if not self.is_processing:
+                        break
+                    
+                    # 진행 상황 업데이트
+                    self._mark_progress(text=f"처리 중... ({i + 1}/{total}) - {filename}")
+                    
+                    if future is None:
+                        result_data = cache[key]
+                    else:
+                        result_data, log_text = future.result()
+                        if log_text:
+                            output.stream.write(log_text)
+                        # 미분류는 다음 실행에서 다시 조회하도록 캐시하지 않음
+                        if key is not None and result_data['genre'] != '미분류':
+                            cache[key] = result_data
+                            self._classify_cache_dirty = True
+                    
+                    result = {
+                        'filename': filename,
+                        'title': result_data.get('title', filename),
+                        'genre': result_data['genre'],
+                        'confidence': result_data['confidence'],
+                        'method': result_data['method'],
+                        'details': result_data.get('details', {})
+                    }
+                    
+                    # 결과 추가 (행 반영 주기마다 한 번에 처리)
+                    self._queue_result(result)
+                    
+                    # 진행률 업데이트
+                    self._mark_progress(value=(i + 1) / total * 100)
+            finally:
+                # 중지 시 아직 시작하지 않은 분류는 취소 (진행 중인 요청만 마무리)
+                executor.shutdown(wait=False, cancel_futures=True)
+                if output is not None and sys.stdout is output:
+                    sys.stdout = output.stream
+        
+        if use_naver:
+            self._prune_classify_cache(directory, identities)
         
         # 완료
         self.root.after(0, self.finish_processing)
     
-    def update_progress(self, current, total, filename):
-        """진행 상황 업데이트"""
-        self.progress_label.config(
-            text=f"처리 중... ({current}/{total}) - {filename}"
-        )
+    def _classify_workers(self, use_naver, use_api):
+        """동시 분류 스레드 수 (네이버 API 사용 여부별 기본값, 환경 변수로 변경 가능)"""
+        if not use_naver:
+            return 1
+        if use_api:
+            env_name, default = 'CLASSIFY_WORKERS_API', self.CLASSIFY_WORKERS_API
+        else:
+            env_name, default = 'CLASSIFY_WORKERS_CRAWL', self.CLASSIFY_WORKERS_CRAWL
+        try:
+            return max(1, int(os.getenv(env_name, default)))
+        except ValueError:
+            return default
+    
+    @staticmethod
+    def _file_identity(path):
+        """파일 식별 문자열 (경로|크기|수정 시각, 파일 정보를 읽을 수 없으면 None)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"{os.path.normcase(os.path.abspath(path))}|{stat.st_size}|{stat.st_mtime_ns}"
+    
+    def _prune_classify_cache(self, directory, identities):
+        """
+        조회한 디렉토리의 캐시 항목 중 더 이상 맞지 않는 항목 삭제
+        
+        이번에 조회한 파일이 아니면서 삭제되었거나 크기/수정 시각이 바뀐 파일의 항목을 지웁니다.
+        (확장자 필터로 이번에 빠진 파일의 항목은 유지)
+        """
+        directory = os.path.normcase(os.path.abspath(directory))
+        live = set(identities)
+        stale = []
+        for key in self._classify_cache:
+            identity = key.rsplit('|', 1)[0]
+            if identity in live:
+                continue
+            path = identity.rsplit('|', 2)[0]
+            if os.path.dirname(path) == directory and self._file_identity(path) != identity:
+                stale.append(key)
+        
+        for key in stale:
+            del self._classify_cache[key]
+        if stale:
+            self._classify_cache_dirty = True
+    
+    @staticmethod
+    def _load_classify_cache():
+        """분류 결과 캐시 불러오기 (파일이 없거나 다른 버전/키 형식에서 만든 캐시면 빈 캐시)"""
+        try:
+            with open(get_classify_cache_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if (not isinstance(data, dict) or data.get('version') != __version__
+                or data.get('format') != CLASSIFY_CACHE_FORMAT):
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+    
+    def _save_classify_cache(self):
+        """새 분류 결과가 있으면 캐시 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self._classify_cache_dirty:
+            return
+        
+        # 최대 항목 수를 넘으면 먼저 저장된(오래된) 항목부터 삭제
+        cache = self._classify_cache
+        overflow = len(cache) - self.CLASSIFY_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            for key in list(itertools.islice(cache, overflow)):
+                del cache[key]
+        
+        cache_path = get_classify_cache_path()
+        temp_path = cache_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': __version__, 'format': CLASSIFY_CACHE_FORMAT, 'entries': cache},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+            self._classify_cache_dirty = False
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️  분류 캐시 저장 실패: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def _mark_progress(self, value=None, text=None):
+        """
+        진행 상황 갱신 예약 (작업 스레드에서 호출)
+        
+        마지막 값만 기억해 두었다가 PROGRESS_REFRESH_MS마다 한 번만 위젯에 반영합니다.
+        """
+        if value is not None:
+            self._progress_value = value
+        if text is not None:
+            self._progress_text = text
+        if self._progress_job is None:
+            self._progress_job = self.root.after(self.PROGRESS_REFRESH_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """예약된 진행 상황을 진행 상태바/라벨에 반영"""
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+        
+        value, self._progress_value = self._progress_value, None
+        text, self._progress_text = self._progress_text, None
+        if value is not None:
+            self.progress_bar.config(value=value)
+        if text is not None:
+            self.progress_label.config(text=_fit_text(text, self.PROGRESS_LABEL_WIDTH))
+    
+    def _queue_result(self, result):
+        """
+        작업 스레드에서 결과 전달
+        
+        결과마다 root.after(0, ...) 이벤트를 보내지 않고 큐에 쌓아 두었다가
+        ROW_FLUSH_INTERVAL_MS마다 _flush_rows에서 한 번에 추가합니다.
+        """
+        self._incoming_results.append(result)
+        if self._flush_rows_job is None:
+            self._flush_rows_job = self.root.after(self.ROW_FLUSH_INTERVAL_MS, self._flush_rows)
     
     def add_result(self, result):
         """결과 추가"""
+        self._append_result(result)
+        if self._flush_rows_job is None:
+            self._flush_rows_job = self.root.after(self.ROW_FLUSH_INTERVAL_MS, self._flush_rows)
+    
+    def _append_result(self, result):
+        """결과 목록에 추가하고 트리뷰 반영 대기 행 생성"""
         self.results.append(result)
+        self._results_version += 1
+        self._count_result(result)
         
-        # 파일명에서 폴더명 제거
-        filename_only = os.path.basename(result['filename'])
-        
-        # 제목 가져오기 (경로가 아니므로 basename 불필요)
-        title = result['title'] or '-'
-        
-        # 트리뷰에 추가
-        confidence_str = f"{result['confidence']:.0%}" if result['confidence'] > 0 else "-"
-        
+        # 트리뷰 삽입/통계 갱신은 모아서 한 번에 처리 (결과마다 다시 그리지 않음)
         # 장르에 따라 색상 구분
-        tag = result['genre']
-        
-        self.tree.insert('', tk.END, values=(
-            filename_only,
-            title,
+        self._pending_rows.append((self._result_row_values(result), result['genre'], result))
+    
+    def _count_result(self, result, delta=1):
+        """통계 누적 집계에 결과 반영 (delta=-1이면 집계에서 제외)"""
+        self._genre_counts[result['genre']] += delta
+        self._method_counts[result['method']] += delta
+        confidence = result['confidence']
+        if confidence > 0:
+            self._confidence_sum += delta * confidence
+            self._confidence_count += delta
+    
+    def _result_row_values(self, result):
+        """
+        결과 하나의 표시 값 (트리뷰 행과 텍스트 저장에서 같은 형식 사용)
+        
+        Returns:
+            (파일명, 제목, 장르, 신뢰도 문자열, 출처) - RESULT_COLUMNS 순서
+        """
+        return (
+            os.path.basename(result['filename']),  # 파일명에서 폴더명 제거
+            result['title'] or '-',
             result['genre'],
-            confidence_str,
+            f"{result['confidence']:.0%}" if result['confidence'] > 0 else "-",
             self._simplify_method(result['method'], result.get('details'))
-        ), tags=(tag,))
+        )
+    
+    def _flush_rows(self):
+        """대기 중인 결과 행을 트리뷰에 삽입하고 통계를 한 번 갱신"""
+        if self._flush_rows_job is not None:
+            self.root.after_cancel(self._flush_rows_job)
+            self._flush_rows_job = None
+        
+        # 작업 스레드가 넘긴 결과 추가 (예약 해제 후 꺼내므로 그 뒤에 들어온 결과는 다음 예약에서 처리)
+        incoming = self._incoming_results
+        while incoming:
+            self._append_result(incoming.popleft())
+        
+        if not self._pending_rows:
+            return
+        
+        rows, self._pending_rows = self._pending_rows, []
+        insert = self.tree.insert
+        row_values = self._row_values
+        row_results = self._row_results
+        for values, tag, result in rows:
+            item = insert('', tk.END, values=values, tags=(tag,))
+            row_values[item] = values
+            row_results[item] = result
         
         # 통계 업데이트
-        self.update_statistics()
+        self._schedule_statistics_update()
     
 
     def finish_processing(self):
         """처리 완료"""
+        self._flush_progress()
+        self._flush_rows()
+        self.update_statistics()
+        self._save_classify_cache()
+        # 분류가 끝나면 출력이 멈추므로 버퍼에 남은 로그를 바로 파일에 기록
+        if sys.stdout is not None:
+            sys.stdout.flush()
         self.is_processing = False
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
@@ -1281,15 +1782,13 @@ class GenreClassifierGUI:
         button_frame.pack(pady=(20, 0))
         
         save_format_btn = tk.Button(button_frame, text="💾 저장", command=do_save,
-                                    font=("맑은 고딕", 11, "bold"), width=12,
-                                    bg=self.colors['success'], fg='white',
-                                    relief='raised', bd=2, cursor='hand2')
+                                    width=12,
+                                    bg=self.colors['success'], bd=2)
         save_format_btn.pack(side=tk.LEFT, padx=10)
         
         cancel_format_btn = tk.Button(button_frame, text="❌ 취소", command=do_cancel,
-                                     font=("맑은 고딕", 11, "bold"), width=12,
-                                     bg=self.colors['gray'], fg='white',
-                                     relief='raised', bd=2, cursor='hand2')
+                                     width=12,
+                                     bg=self.colors['gray'], bd=2)
         cancel_format_btn.pack(side=tk.LEFT, padx=10)
     
     def _save_as_json(self):
@@ -1302,8 +1801,14 @@ class GenreClassifierGUI:
         
         if filename:
             try:
+                # 결과 하나당 한 줄로 기록 (indent 없이 dumps를 써야 C 인코더 사용)
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.results, f, ensure_ascii=False, indent=2)
+                    f.write('[\n')
+                    for i, result in enumerate(self.results):
+                        if i:
+                            f.write(',\n')
+                        f.write(json.dumps(result, ensure_ascii=False))
+                    f.write('\n]\n')
                 
                 messagebox.showinfo("저장 완료", f"JSON 파일로 저장되었습니다:\n{filename}")
             except Exception as e:
@@ -1319,98 +1824,106 @@ class GenreClassifierGUI:
         
         if filename:
             try:
-                from collections import Counter, defaultdict
+                # 내용은 메모리에서 모두 만든 뒤 파일에 한 번에 기록
+                buf = io.StringIO()
+                w = buf.write
+                results = self.results
+                total = len(results)
                 
-                with open(filename, 'w', encoding='utf-8') as f:
-                    # 헤더
-                    f.write("╔" + "═"*98 + "╗\n")
-                    f.write("║" + " "*35 + "웹소설 장르 분류 결과" + " "*43 + "║\n")
-                    f.write("╠" + "═"*98 + "╣\n")
-                    f.write(f"║  생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}" + " "*68 + "║\n")
-                    f.write(f"║  총 파일 수: {len(self.results)}개" + " "*(85-len(str(len(self.results)))) + "║\n")
-                    f.write("╚" + "═"*98 + "╝\n\n")
-                    
-                    # 통계
-                    genres = [r['genre'] for r in self.results]
-                    genre_counts = Counter(genres)
-                    
-                    # 평균 신뢰도
-                    confidences = [r['confidence'] for r in self.results if r['confidence'] > 0]
-                    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-                    
-                    f.write("┌─ 📊 통계 요약 " + "─"*83 + "┐\n")
-                    f.write("│\n")
-                    f.write(f"│  평균 신뢰도: {avg_confidence:.1%}\n")
-                    f.write("│\n")
-                    f.write("│  장르별 분포:\n")
-                    for genre, count in genre_counts.most_common():
-                        percentage = count / len(self.results) * 100
-                        bar_length = int(percentage / 2)  # 50% = 25칸
-                        bar = "█" * bar_length + "░" * (25 - bar_length)
-                        f.write(f"│    {genre:8s} │ {bar} │ {count:3d}개 ({percentage:5.1f}%)\n")
-                    f.write("│\n")
-                    f.write("└" + "─"*98 + "┘\n\n")
-                    
-                    # 장르별로 그룹화
-                    genre_groups = defaultdict(list)
-                    for result in self.results:
-                        genre_groups[result['genre']].append(result)
+                # 헤더
+                w("╔" + "═"*98 + "╗\n")
+                # 오른쪽 테두리는 표시 너비 기준으로 맞춤 (한글은 2칸)
+                w(_pad_display("║" + " "*35 + "웹소설 장르 분류 결과", 99) + "║\n")
+                w("╠" + "═"*98 + "╣\n")
+                w(_pad_display(f"║  생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 99) + "║\n")
+                w(_pad_display(f"║  총 파일 수: {total}개", 99) + "║\n")
+                w("╚" + "═"*98 + "╝\n\n")
+                
+                # 장르별 그룹화와 평균 신뢰도를 한 번의 순회로 계산
+                genre_groups = defaultdict(list)
+                confidence_sum = 0
+                confidence_count = 0
+                for result in results:
+                    genre_groups[result['genre']].append(result)
+                    confidence = result['confidence']
+                    if confidence > 0:
+                        confidence_sum += confidence
+                        confidence_count += 1
+                avg_confidence = confidence_sum / confidence_count if confidence_count else 0
+                
+                # 개수 많은 순 (같으면 먼저 나온 장르 먼저, Counter.most_common과 같은 순서)
+                ordered_groups = sorted(genre_groups.items(), key=lambda item: len(item[1]), reverse=True)
+                
+                w("┌─ 📊 통계 요약 " + "─"*83 + "┐\n")
+                w("│\n")
+                w(f"│  평균 신뢰도: {avg_confidence:.1%}\n")
+                w("│\n")
+                w("│  장르별 분포:\n")
+                for genre, results_in_genre in ordered_groups:
+                    count = len(results_in_genre)
+                    percentage = count / total * 100
+                    bar_length = int(percentage / 2)  # 50% = 25칸
+                    bar = "█" * bar_length + "░" * (25 - bar_length)
+                    w(f"│    {_pad_display(genre, 8)} │ {bar} │ {count:3d}개 ({percentage:5.1f}%)\n")
+                w("│\n")
+                w("└" + "─"*98 + "┘\n\n")
+                
+                # 장르별로 출력
+                for genre, results_in_genre in ordered_groups:
+                    # 장르 헤더
+                    header = f"┌─ 📁 {genre} ({len(results_in_genre)}개)"
+                    fill = max(0, 99 - _display_width(header))
+                    w("\n" + header + " "*(fill % 2) + " ─"*(fill // 2) + "┐\n")
                     
-                    # 장르별로 출력
-                    for genre, count in genre_counts.most_common():
-                        results_in_genre = genre_groups[genre]
+                    # 해당 장르의 작품들
+                    for i, result in enumerate(results_in_genre, 1):
+                        filename_only, _, _, confidence, method = self._result_row_values(result)
+                        title = result['title']
                         
-                        # 장르 헤더
-                        f.write("\n" + "┌─ " + f"📁 {genre} ({len(results_in_genre)}개)" + " ─"*(92-len(genre)-len(str(len(results_in_genre)))) + "┐\n")
+                        # 신뢰도 아이콘
+                        if result['confidence'] >= 0.95:
+                            conf_icon = "✓✓"
+                        elif result['confidence'] >= 0.85:
+                            conf_icon = "✓ "
+                        elif result['confidence'] > 0:
+                            conf_icon = "○ "
+                        else:
+                            conf_icon = "? "
                         
-                        # 해당 장르의 작품들
-                        for i, result in enumerate(results_in_genre, 1):
-                            filename_only = os.path.basename(result['filename'])
-                            title = result['title']
-                            confidence = f"{result['confidence']:.0%}" if result['confidence'] > 0 else "-"
-                            method = self._simplify_method(result['method'], result.get('details'))
-                            
-                            # 신뢰도 아이콘
-                            if result['confidence'] >= 0.95:
-                                conf_icon = "✓✓"
-                            elif result['confidence'] >= 0.85:
-                                conf_icon = "✓ "
-                            elif result['confidence'] > 0:
-                                conf_icon = "○ "
-                            else:
-                                conf_icon = "? "
-                            
-                            # 파일명 (최대 50자)
-                            if len(filename_only) > 50:
-                                filename_display = filename_only[:47] + "..."
-                            else:
-                                filename_display = filename_only
-                            
-                            f.write(f"│ {i:3d}. {conf_icon} {filename_display}\n")
-                            
-                            # 제목 (최대 50자)
-                            if len(title) > 50:
-                                title_display = title[:47] + "..."
-                            else:
-                                title_display = title
-                            f.write(f"│      제목: {title_display}\n")
-                            
-                            # 신뢰도와 출처
-                            f.write(f"│      신뢰도: {confidence:5s} │ 출처: {method}\n")
-                            
-                            if i < len(results_in_genre):
-                                f.write("│      " + "─"*90 + "\n")
+                        # 파일명 (최대 50자)
+                        if len(filename_only) > 50:
+                            filename_display = filename_only[:47] + "..."
+                        else:
+                            filename_display = filename_only
                         
-                        f.write("└" + "─"*98 + "┘\n")
+                        w(f"│ {i:3d}. {conf_icon} {filename_display}\n")
+                        
+                        # 제목 (최대 50자)
+                        if len(title) > 50:
+                            title_display = title[:47] + "..."
+                        else:
+                            title_display = title
+                        w(f"│      제목: {title_display}\n")
+                        
+                        # 신뢰도와 출처
+                        w(f"│      신뢰도: {confidence:5s} │ 출처: {method}\n")
+                        
+                        if i < len(results_in_genre):
+                            w("│      " + "─"*90 + "\n")
                     
-                    # 푸터
-                    f.write("\n" + "╔" + "═"*98 + "╗\n")
-                    f.write("║  범례:                                                                                           ║\n")
-                    f.write("║    ✓✓ = 95% 이상 (매우 높은 신뢰도)                                                              ║\n")
-                    f.write("║    ✓  = 85% 이상 (높은 신뢰도)                                                                   ║\n")
-                    f.write("║    ○  = 85% 미만 (중간 신뢰도)                                                                   ║\n")
-                    f.write("║    ?  = 미분류 (수동 확인 필요)                                                                  ║\n")
-                    f.write("╚" + "═"*98 + "╝\n")
+                    w("└" + "─"*98 + "┘\n")
+                
+                # 푸터
+                w("\n" + "╔" + "═"*98 + "╗\n")
+                w("║  범례:                                                                                           ║\n")
+                w("║    ✓✓ = 95% 이상 (매우 높은 신뢰도)                                                              ║\n")
+                w("║    ✓  = 85% 이상 (높은 신뢰도)                                                                   ║\n")
+                w("║    ○  = 85% 미만 (중간 신뢰도)                                                                   ║\n")
+                w("║    ?  = 미분류 (수동 확인 필요)                                                                  ║\n")
+                w("╚" + "═"*98 + "╝\n")
+                
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(buf.getvalue())
                 
                 messagebox.showinfo("저장 완료", f"텍스트 파일로 저장되었습니다:\n{filename}")
             except Exception as e:
@@ -1426,103 +1939,107 @@ class GenreClassifierGUI:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    # 헤더
-                    f.write("="*100 + "\n")
-                    f.write("웹소설 장르 분류 결과 (상세)\n")
-                    f.write(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"총 파일 수: {len(self.results)}개\n")
-                    f.write("="*100 + "\n\n")
+                # 내용은 메모리에서 모두 만든 뒤 파일에 한 번에 기록
+                buf = io.StringIO()
+                w = buf.write
+                results = self.results
+                total = len(results)
+                
+                # 헤더
+                w(_SEP_EQ + "\n")
+                w("웹소설 장르 분류 결과 (상세)\n")
+                w(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                w(f"총 파일 수: {total}개\n")
+                w(_SEP_EQ + "\n\n")
+                
+                # 각 파일별 상세 정보 (고정된 블록은 f-string 하나로 만들어 한 번에 기록)
+                for i, result in enumerate(results, 1):
+                    # 기본 정보, 최종 결과
+                    w(
+                        f"\n{_SEP_EQ}\n"
+                        f"[{i}/{total}] {os.path.basename(result['filename'])}\n"
+                        f"{_SEP_EQ}\n\n"
+                        "【파일 정보】\n"
+                        f"  파일명: {result['filename']}\n"
+                        f"  추출된 제목: {result['title']}\n\n"
+                        "【최종 분류 결과】\n"
+                        f"  장르: {result['genre']}\n"
+                        f"  신뢰도: {result['confidence']:.1%}\n"
+                        f"  출처: {self._simplify_method(result['method'], result.get('details'))}\n\n"
+                    )
                     
-                    # 각 파일별 상세 정보
-                    for i, result in enumerate(self.results, 1):
-                        f.write(f"\n{'='*100}\n")
-                        f.write(f"[{i}/{len(self.results)}] {os.path.basename(result['filename'])}\n")
-                        f.write(f"{'='*100}\n\n")
+                    # 상세 정보
+                    if result.get('details'):
+                        details = result['details']
                         
-                        # 기본 정보
-                        f.write("【파일 정보】\n")
-                        f.write(f"  파일명: {result['filename']}\n")
-                        f.write(f"  추출된 제목: {result['title']}\n\n")
+                        # 파일명 기반 결과
+                        if details.get('filename_result'):
+                            fn = details['filename_result']
+                            w(
+                                "【파일명 기반 분류】\n"
+                                f"  장르: {fn['genre']}\n"
+                                f"  신뢰도: {fn['confidence']:.1%}\n"
+                                f"  출처: {fn['method']}\n\n"
+                            )
                         
-                        # 최종 결과
-                        f.write("【최종 분류 결과】\n")
-                        f.write(f"  장르: {result['genre']}\n")
-                        f.write(f"  신뢰도: {result['confidence']:.1%}\n")
-                        f.write(f"  출처: {self._simplify_method(result['method'], result.get('details'))}\n\n")
-                        
-                        # 상세 정보
-                        if result.get('details'):
-                            details = result['details']
+                        # 네이버 검색 결과
+                        if details.get('naver_result') and details['naver_result'].get('genre'):
+                            nv = details['naver_result']
+                            w(
+                                "【네이버 검색 결과 (노벨피아 우선)】\n"
+                                f"  장르: {nv['genre']}\n"
+                                f"  신뢰도: {nv['confidence']:.1%}\n"
+                                f"  출처: {nv['source']}\n"
+                            )
                             
-                            # 파일명 기반 결과
-                            if details.get('filename_result'):
-                                fn = details['filename_result']
-                                f.write("【파일명 기반 분류】\n")
-                                f.write(f"  장르: {fn['genre']}\n")
-                                f.write(f"  신뢰도: {fn['confidence']:.1%}\n")
-                                f.write(f"  출처: {fn['method']}\n\n")
+                            if nv.get('raw_genre'):
+                                w(f"  원본 장르: {nv['raw_genre']}\n")
                             
-                            # 네이버 검색 결과
-                            if details.get('naver_result') and details['naver_result'].get('genre'):
-                                nv = details['naver_result']
-                                f.write("【네이버 검색 결과 (노벨피아 우선)】\n")
-                                f.write(f"  장르: {nv['genre']}\n")
-                                f.write(f"  신뢰도: {nv['confidence']:.1%}\n")
-                                f.write(f"  출처: {nv['source']}\n")
-                                
-                                if nv.get('raw_genre'):
-                                    f.write(f"  원본 장르: {nv['raw_genre']}\n")
-                                
-                                if nv.get('url'):
-                                    f.write(f"  URL: {nv['url']}\n")
-                                
-                                # 신뢰도 설명
-                                confidence = nv['confidence']
-                                if confidence >= 0.95:
-                                    f.write("  ✓ 매우 높은 신뢰도 (공식 메타 태그)\n")
-                                elif confidence >= 0.85:
-                                    f.write("  ✓ 높은 신뢰도 (공식 플랫폼 페이지)\n")
-                                elif confidence >= 0.75:
-                                    f.write("  ○ 중간 신뢰도 (구조화된 데이터)\n")
-                                else:
-                                    f.write("  △ 낮은 신뢰도 (추측)\n")
-                                
-                                f.write("\n")
-                        
-                        f.write("-"*100 + "\n")
-                    
-                    # 통계 요약
-                    f.write(f"\n{'='*100}\n")
-                    f.write("【전체 통계】\n")
-                    f.write(f"{'='*100}\n\n")
-                    
-                    from collections import Counter
-                    genres = [r['genre'] for r in self.results]
-                    genre_counts = Counter(genres)
-                    
-                    f.write("장르별 분포:\n")
-                    for genre, count in genre_counts.most_common():
-                        percentage = count / len(self.results) * 100
-                        f.write(f"  {genre:10s}: {count:4d}개 ({percentage:5.1f}%)\n")
-                    
-                    f.write("\n")
-                    
-                    # 출처별 통계
-                    methods = [r['method'] for r in self.results]
-                    method_counts = Counter(methods)
-                    
-                    f.write("출처별 분포:\n")
-                    for method, count in method_counts.most_common():
-                        percentage = count / len(self.results) * 100
-                        f.write(f"  {method:20s}: {count:4d}개 ({percentage:5.1f}%)\n")
-                    
-                    f.write("\n")
+                            if nv.get('url'):
+                                w(f"  URL: {nv['url']}\n")
+                            
+                            # 신뢰도 설명
+                            confidence = nv['confidence']
+                            if confidence >= 0.95:
+                                w("  ✓ 매우 높은 신뢰도 (공식 메타 태그)\n")
+                            elif confidence >= 0.85:
+                                w("  ✓ 높은 신뢰도 (공식 플랫폼 페이지)\n")
+                            elif confidence >= 0.75:
+                                w("  ○ 중간 신뢰도 (구조화된 데이터)\n")
+                            else:
+                                w("  △ 낮은 신뢰도 (추측)\n")
+                            
+                            w("\n")
                     
-                    # 평균 신뢰도
-                    confidences = [r['confidence'] for r in self.results if r['confidence'] > 0]
-                    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-                    f.write(f"평균 신뢰도: {avg_confidence:.1%}\n")
+                    w(_SEP_DASH + "\n")
+                
+                # 통계 요약
+                w(f"\n{_SEP_EQ}\n")
+                w("【전체 통계】\n")
+                w(f"{_SEP_EQ}\n\n")
+                
+                genre_counts, method_counts, avg_confidence = self._summarize_results(results)
+                
+                w("장르별 분포:\n")
+                for genre, count in genre_counts.most_common():
+                    percentage = count / total * 100
+                    w(f"  {genre:10s}: {count:4d}개 ({percentage:5.1f}%)\n")
+                
+                w("\n")
+                
+                # 출처별 통계
+                w("출처별 분포:\n")
+                for method, count in method_counts.most_common():
+                    percentage = count / total * 100
+                    w(f"  {method:20s}: {count:4d}개 ({percentage:5.1f}%)\n")
+                
+                w("\n")
+                
+                # 평균 신뢰도
+                w(f"평균 신뢰도: {avg_confidence:.1%}\n")
+                
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(buf.getvalue())
                 
                 messagebox.showinfo("저장 완료", f"상세 텍스트 파일로 저장되었습니다:\n{filename}")
             except Exception as e:
@@ -1531,12 +2048,26 @@ class GenreClassifierGUI:
     def clear_results(self):
         """결과 초기화"""
         self.results = []
-        
-        # 트리뷰 초기화
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._results_version += 1
+        self._genre_counts.clear()
+        self._method_counts.clear()
+        self._confidence_sum = 0
+        self._confidence_count = 0
+        
+        # 아직 반영되지 않은 행 폐기
+        if self._flush_rows_job is not None:
+            self.root.after_cancel(self._flush_rows_job)
+            self._flush_rows_job = None
+        self._incoming_results.clear()
+        self._pending_rows = []
+        
+        # 트리뷰 초기화 (모든 행을 한 번의 호출로 삭제)
+        self.tree.delete(*self.tree.get_children())
+        self._row_values.clear()
+        self._row_results.clear()
         
         # 진행률 초기화
+        self._flush_progress()
         self.progress_bar.config(value=0)
         self.progress_label.config(text="대기 중...")
         
@@ -1555,26 +2086,44 @@ class GenreClassifierGUI:
         
         self.root.destroy()
     
+    @staticmethod
+    def _summarize_results(results):
+        """
+        결과 목록을 한 번 순회해 통계 계산
+        
+        Returns:
+            (장르별 Counter, method별 Counter, 평균 신뢰도 - 신뢰도 0 제외)
+        """
+        genre_counts = Counter()
+        method_counts = Counter()
+        confidence_sum = 0
+        confidence_count = 0
+        for r in results:
+            genre_counts[r['genre']] += 1
+            method_counts[r['method']] += 1
+            confidence = r['confidence']
+            if confidence > 0:
+                confidence_sum += confidence
+                confidence_count += 1
+        
+        avg_confidence = confidence_sum / confidence_count if confidence_count else 0
+        return genre_counts, method_counts, avg_confidence
+    
     def update_statistics(self):
         """통계 업데이트"""
+        if self._stats_job is not None:
+            self.root.after_cancel(self._stats_job)
+            self._stats_job = None
+        
         if not self.results:
-            self.stats_text.config(state=tk.NORMAL)
-            self.stats_text.delete('1.0', tk.END)
-            self.stats_text.insert('1.0', "통계: 파일 0개")
-            self.stats_text.config(state=tk.DISABLED)
+            self._render_stats("통계: 파일 0개")
             return
         
-        from collections import Counter
-        
+        # 누적 집계 사용 (단항 +로 0개가 된 항목 제외)
         total = len(self.results)
-        genres = [r['genre'] for r in self.results]
-        genre_counts = Counter(genres)
-        
-        confidences = [r['confidence'] for r in self.results if r['confidence'] > 0]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        
-        methods = [r['method'] for r in self.results]
-        method_counts = Counter(methods)
+        genre_counts = +self._genre_counts
+        method_counts = +self._method_counts
+        avg_confidence = self._confidence_sum / self._confidence_count if self._confidence_count else 0
         
         # 통계 텍스트 생성
         stats = []
@@ -1594,18 +2143,55 @@ class GenreClassifierGUI:
             percentage = count / total * 100
             stats.append(f"  {method:15s}: {count:3d}개 ({percentage:5.1f}%)")
         
+        self._render_stats('\n'.join(stats))
+    
+    def _render_stats(self, text):
+        """통계 패널 내용을 한 번의 삭제/삽입으로 교체 (통계 창에서 재사용하도록 문자열 보관)"""
+        self._stats_rendered = text
         self.stats_text.config(state=tk.NORMAL)
         self.stats_text.delete('1.0', tk.END)
-        self.stats_text.insert('1.0', '\n'.join(stats))
+        self.stats_text.insert('1.0', text)
         self.stats_text.config(state=tk.DISABLED)
     
+    def _schedule_statistics_update(self):
+        """분류 중 통계 갱신 예약 (STATS_REFRESH_MS 동안 여러 요청을 한 번으로 합침)"""
+        if self._stats_job is None:
+            self._stats_job = self.root.after(self.STATS_REFRESH_MS, self.update_statistics)
+    
     def sort_column(self, col):
-        """컬럼 정렬"""
-        items = [(self.tree.set(item, col), item) for item in self.tree.get_children('')]
-        items.sort()
+        """
+        컬럼 정렬 (행 값은 트리뷰 대신 _row_values 캐시에서 읽음)
+        
+        신뢰도는 표시 문자열 대신 결과의 신뢰도 값(float)으로 비교하고,
+        정렬된 순서는 set_children 한 번으로 반영합니다.
+        """
+        idx = self.RESULT_COLUMNS.index(col)
+        row_values = self._row_values
+        if col == '신뢰도':
+            row_results = self._row_results
+            def sort_key(item):
+                return row_results[item]['confidence']
+        else:
+            def sort_key(item):
+                return row_values[item][idx]
         
-        for index, (val, item) in enumerate(items):
-            self.tree.move(item, '', index)
+        items = sorted(self.tree.get_children(''), key=sort_key)
+        self.tree.set_children('', *items)
+    
+    def _set_row_values(self, item, values, **kwargs):
+        """결과 트리뷰 행 값 변경 (정렬용 캐시도 함께 갱신)"""
+        values = tuple(str(v) for v in values)
+        self.tree.item(item, values=values, **kwargs)
+        self._row_values[item] = values
+    
+    def _delete_rows(self, items):
+        """결과 트리뷰 여러 행을 한 번에 삭제 (정렬용 캐시도 함께 제거)"""
+        if not items:
+            return
+        self.tree.delete(*items)
+        for item in items:
+            self._row_values.pop(item, None)
+            self._row_results.pop(item, None)
     
     def show_detail(self):
         """상세 정보 표시"""
@@ -1614,12 +2200,8 @@ class GenreClassifierGUI:
             messagebox.showinfo("알림", "항목을 선택해주세요.")
             return
         
-        item = selection[0]
-        values = self.tree.item(item)['values']
-        
         # 결과에서 찾기
-        filename = values[0]
-        result = next((r for r in self.results if r['filename'] == filename), None)
+        result = self._row_results.get(selection[0])
         
         if not result:
             return
@@ -1689,20 +2271,9 @@ class GenreClassifierGUI:
                 self._add_info_row(scrollable_frame, "출처", nv['source'])
                 
                 # 출처별 설명
-                source_desc = {
-                    'ridibooks_page': '리디북스 공식 페이지',
-                    'ridibooks_meta': '리디북스 메타 태그',
-                    'ridibooks_link': '리디북스 장르 링크',
-                    'novelpia_page': '노벨피아 공식 페이지',
-                    'novelpia_meta': '노벨피아 메타 태그',
-                    'novelpia_tag': '노벨피아 태그',
-                    'naver_series_page': '네이버시리즈 공식 페이지',
-                    'naver_series_meta': '네이버시리즈 메타 태그',
-                    'naver_search': '네이버 검색 결과'
-                }
-                
-                if nv['source'] in source_desc:
-                    self._add_info_row(scrollable_frame, "출처 설명", source_desc[nv['source']])
+                source_desc = self.NAVER_SOURCE_DESCRIPTIONS.get(nv['source'])
+                if source_desc:
+                    self._add_info_row(scrollable_frame, "출처 설명", source_desc)
                 
                 if nv.get('raw_genre'):
                     self._add_info_row(scrollable_frame, "원본 장르", nv['raw_genre'])
@@ -1750,12 +2321,12 @@ class GenreClassifierGUI:
             return
         
         item = selection[0]
-        values = self.tree.item(item)['values']
+        values = self._row_values[item]
         filename = values[0]
         current_genre = values[2]
         
         # 결과에서 찾기
-        result = next((r for r in self.results if os.path.basename(r['filename']) == filename), None)
+        result = self._row_results.get(item)
         if not result:
             return
         
@@ -1802,18 +2373,10 @@ class GenreClassifierGUI:
                 font=("맑은 고딕", 12, "bold"), 
                 bg=self.colors['tree_bg']).pack(pady=(10, 5))
         
-        # 장르 목록 (색상별 그룹화)
-        genre_groups = {
-            '판타지 계열': ['판타지', '퓨판', '겜판', '현판'],
-            '로맨스 계열': ['로판', '언정'],
-            '무협/선협': ['무협', '선협'],
-            '기타': ['SF', '스포츠', '역사', '밀리터리', '패러디', '현대', '소설', '미분류']
-        }
-        
         genre_var = tk.StringVar(value=current_genre)
         
         # 그룹별로 라디오 버튼 배치
-        for group_name, genres in genre_groups.items():
+        for group_name, genres in self.EDIT_GENRE_GROUPS:
             group_frame = tk.LabelFrame(selection_frame, text=group_name, 
                                        font=("맑은 고딕", 10, "bold"),
                                        bg=self.colors['tree_bg'])
@@ -1825,20 +2388,11 @@ class GenreClassifierGUI:
                 row = i // 2
                 
                 # 장르별 색상 적용
-                genre_colors = {
-                    '무협': '#FF6B6B', '로판': '#FF69B4', '현판': '#4ECDC4',
-                    '퓨판': '#45B7D1', '겜판': '#96CEB4', '선협': '#FFEAA7',
-                    '역사': '#DDA0DD', 'SF': '#87CEEB', '스포츠': '#FFA500',
-                    '밀리터리': '#556B2F', '패러디': '#DA70D6',
-                    '언정': '#F0A0A0', '현대': '#B0C4DE', '소설': '#D3D3D3',
-                    '판타지': '#9B59B6', '미분류': '#F5F5F5'
-                }
-                
-                color = genre_colors.get(genre, '#E0E0E0')
+                color, foreground = self.EDIT_GENRE_COLORS.get(genre, self.EDIT_GENRE_DEFAULT_COLOR)
                 
                 radio = tk.Radiobutton(group_frame, text=f"  {genre}  ", value=genre,
                                      variable=genre_var, font=("맑은 고딕", 11),
-                                     bg=color, fg='white' if genre in ['무협', 'SF'] else 'black',
+                                     bg=color, fg=foreground,
                                      selectcolor=color, activebackground=color,
                                      indicatoron=0, width=8, relief='raised', bd=2)
                 radio.grid(row=row, column=col, padx=5, pady=3, sticky='ew')
@@ -1855,11 +2409,14 @@ class GenreClassifierGUI:
                 return
             
             # 결과 업데이트
+            self._count_result(result, -1)
             result['genre'] = new_genre
             result['method'] = 'manual_edit'  # 수동 수정 표시
+            self._count_result(result)
+            self._results_version += 1
             
             # 트리뷰 업데이트
-            self.tree.item(item, values=(
+            self._set_row_values(item, (
                 filename,
                 values[1],  # 제목
                 new_genre,
@@ -1882,16 +2439,14 @@ class GenreClassifierGUI:
         
         # 저장 버튼 (초록색)
         save_btn = tk.Button(button_frame, text="✅ 저장", command=do_save, 
-                            font=("맑은 고딕", 11, "bold"), width=12,
-                            bg=self.colors['success'], fg='white',
-                            relief='raised', bd=2, cursor='hand2')
+                            width=12,
+                            bg=self.colors['success'], bd=2)
         save_btn.pack(side=tk.LEFT, padx=10)
         
         # 취소 버튼 (회색)
         cancel_btn = tk.Button(button_frame, text="❌ 취소", command=do_cancel,
-                              font=("맑은 고딕", 11, "bold"), width=12,
-                              bg=self.colors['gray'], fg='white',
-                              relief='raised', bd=2, cursor='hand2')
+                              width=12,
+                              bg=self.colors['gray'], bd=2)
         cancel_btn.pack(side=tk.LEFT, padx=10)
     
     def edit_filename(self):
@@ -1906,19 +2461,12 @@ class GenreClassifierGUI:
             return
         
         item = selection[0]
-        values = self.tree.item(item)['values']
-        filename = values[0]
+        values = self._row_values[item]
+        filename = values[0]  # 원본 파일명 또는 수정된 파일명
         extracted_title = values[1]  # 추출된 제목
         
-        # 결과에서 찾기 (원본 파일명 또는 수정된 파일명으로 검색)
-        result = None
-        for r in self.results:
-            original_filename = os.path.basename(r['filename'])
-            custom_filename = r.get('custom_filename', '')
-            
-            if original_filename == filename or custom_filename == filename:
-                result = r
-                break
+        # 결과에서 찾기
+        result = self._row_results.get(item)
         
         if not result:
             messagebox.showerror("오류", "결과를 찾을 수 없습니다.")
@@ -1993,7 +2541,13 @@ class GenreClassifierGUI:
                                 bg=self.colors['tree_bg'], fg=self.colors['primary'])
         preview_label.pack(pady=5)
         
-        def update_preview(*args):
+        preview_job = None  # 입력 중 예약된 미리보기 갱신
+        
+        def update_preview():
+            nonlocal preview_job
+            preview_job = None
+            if not preview_label.winfo_exists():  # 갱신 전에 창이 닫힌 경우
+                return
             new_filename_without_ext = title_var.get().strip()
             if new_filename_without_ext:
                 # 파일 확장자 유지
@@ -2002,7 +2556,14 @@ class GenreClassifierGUI:
             else:
                 preview_label.config(text="파일명을 입력해주세요")
         
-        title_var.trace('w', update_preview)
+        def schedule_preview(*args):
+            """키 입력마다 갱신하지 않고 입력이 멈춘 뒤 한 번만 갱신"""
+            nonlocal preview_job
+            if preview_job is not None:
+                self.root.after_cancel(preview_job)
+            preview_job = self.root.after(self.EDIT_PREVIEW_DELAY_MS, update_preview)
+        
+        title_var.trace('w', schedule_preview)
         update_preview()  # 초기 미리보기
         
         def do_save():
@@ -2022,9 +2583,10 @@ class GenreClassifierGUI:
             # 결과 업데이트 (파일명 변경 정보 저장)
             result['custom_filename'] = new_filename
             result['filename_edited'] = True  # 사용자가 수정했음을 표시
+            self._results_version += 1
             
             # 트리뷰 업데이트 (파일명 열 업데이트)
-            self.tree.item(item, values=(
+            self._set_row_values(item, (
                 new_filename,  # 새 파일명
                 extracted_title,  # 추출된 제목은 그대로
                 values[2],  # 장르
@@ -2044,16 +2606,14 @@ class GenreClassifierGUI:
         
         # 저장 버튼 (초록색)
         save_btn = tk.Button(button_frame, text="✅ 저장", command=do_save, 
-                            font=("맑은 고딕", 11, "bold"), width=12,
-                            bg=self.colors['success'], fg='white',
-                            relief='raised', bd=2, cursor='hand2')
+                            width=12,
+                            bg=self.colors['success'], bd=2)
         save_btn.pack(side=tk.LEFT, padx=10)
         
         # 취소 버튼 (회색)
         cancel_btn = tk.Button(button_frame, text="❌ 취소", command=do_cancel,
-                              font=("맑은 고딕", 11, "bold"), width=12,
-                              bg=self.colors['gray'], fg='white',
-                              relief='raised', bd=2, cursor='hand2')
+                              width=12,
+                              bg=self.colors['gray'], bd=2)
         cancel_btn.pack(side=tk.LEFT, padx=10)
     
     def show_statistics(self):
@@ -2072,7 +2632,10 @@ class GenreClassifierGUI:
                                          font=("맑은 고딕", 12))
         text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        text.insert('1.0', self.stats_text.get('1.0', tk.END))
+        # 예약된 갱신이 남아 있으면 먼저 반영한 뒤, 위젯 대신 보관한 문자열을 사용
+        if self._stats_job is not None:
+            self.update_statistics()
+        text.insert('1.0', self._stats_rendered)
         text.config(state=tk.DISABLED)
     
     def delete_selected(self):
@@ -2085,65 +2648,50 @@ class GenreClassifierGUI:
         if not messagebox.askyesno("확인", f"{len(selection)}개 항목을 삭제하시겠습니까?"):
             return
         
-        # 결과에서 삭제
+        # 결과에서 삭제 (선택 항목의 결과를 모아 한 번에 걸러냄)
+        selected = set()
         for item in selection:
-            values = self.tree.item(item)['values']
-            filename = values[0]
-            self.results = [r for r in self.results if r['filename'] != filename]
-            self.tree.delete(item)
+            result = self._row_results[item]
+            selected.add(id(result))
+            self._count_result(result, -1)
+        self.results = [r for r in self.results if id(r) not in selected]
+        self._results_version += 1
+        self._delete_rows(selection)
         
         self.update_statistics()
     
     def update_rename_preview(self):
         """파일명 변경 미리보기 업데이트"""
-        # 기존 항목 삭제
-        for item in self.preview_tree.get_children():
-            self.preview_tree.delete(item)
+        # 기존 항목 삭제 (한 번의 호출로 삭제)
+        self.preview_tree.delete(*self.preview_tree.get_children())
         
         # 체크박스 상태 초기화
         self.preview_checkboxes = {}
         self.last_clicked_item = None  # Shift 선택 초기화
         
+        format_type = self.rename_format_var.get()
+        self._preview_signature = (self._results_version, format_type)
+        
         if not self.results:
             return
         
-        format_type = self.rename_format_var.get()
+        insert = self.preview_tree.insert
+        format_name = _rename_formatter(format_type)  # 형식 분기는 루프 밖에서 한 번만
         
         for result in self.results:
             if result['genre'] == '미분류':
                 continue
             
-            original = result['filename']
-            genre = result['genre']
+            basename = os.path.basename(result['filename'])
             
-            # 새 파일명 생성
-            basename = os.path.basename(original)
-            
-            # 사용자가 파일명을 직접 수정했으면 그것을 사용
+            # 새 파일명 생성 (사용자가 파일명을 직접 수정했으면 그것을 사용, 이미 확장자 포함)
             if result.get('filename_edited') and result.get('custom_filename'):
-                # 사용자가 수정한 파일명 (이미 확장자 포함)
-                custom_basename = result['custom_filename']
-                name, ext = os.path.splitext(custom_basename)
-                
-                # 장르 추가 형식 적용
-                if format_type == "[장르] 제목":
-                    new_name = f"[{genre}] {name}{ext}"
-                elif format_type == "제목 [장르]":
-                    new_name = f"{name} [{genre}]{ext}"
-                else:  # "장르_제목"
-                    new_name = f"{genre}_{name}{ext}"
+                new_name = format_name(result['custom_filename'], result['genre'])
             else:
-                # 기존 로직 (원본 파일명 사용)
-                if format_type == "[장르] 제목":
-                    new_name = f"[{genre}] {basename}"
-                elif format_type == "제목 [장르]":
-                    name, ext = os.path.splitext(basename)
-                    new_name = f"{name} [{genre}]{ext}"
-                else:  # "장르_제목"
-                    new_name = f"{genre}_{basename}"
+                new_name = format_name(basename, result['genre'])
             
             # 체크박스 추가 (기본값: 선택됨)
-            item_id = self.preview_tree.insert('', tk.END, values=('☑', basename, new_name))
+            item_id = insert('', tk.END, values=('☑', basename, new_name))
             self.preview_checkboxes[item_id] = True
     
     def toggle_preview_checkbox(self, event):
@@ -2164,9 +2712,7 @@ class GenreClassifierGUI:
                         self.preview_checkboxes[item] = new_state
                         
                         # 표시 업데이트
-                        values = list(self.preview_tree.item(item)['values'])
-                        values[0] = '☑' if new_state else '☐'
-                        self.preview_tree.item(item, values=values)
+                        self.preview_tree.set(item, '선택', '☑' if new_state else '☐')
                         
                         # 마지막 클릭 위치 저장 (Shift 선택용)
                         self.last_clicked_item = item
@@ -2178,9 +2724,7 @@ class GenreClassifierGUI:
             current_state = self.preview_checkboxes.get(current_item, True)
             new_state = not current_state
             self.preview_checkboxes[current_item] = new_state
-            values = list(self.preview_tree.item(current_item)['values'])
-            values[0] = '☑' if new_state else '☐'
-            self.preview_tree.item(current_item, values=values)
+            self.preview_tree.set(current_item, '선택', '☑' if new_state else '☐')
             self.last_clicked_item = current_item
             return
         
@@ -2203,9 +2747,7 @@ class GenreClassifierGUI:
             for idx in range(start_idx, end_idx + 1):
                 item = all_items[idx]
                 self.preview_checkboxes[item] = target_state
-                values = list(self.preview_tree.item(item)['values'])
-                values[0] = '☑' if target_state else '☐'
-                self.preview_tree.item(item, values=values)
+                self.preview_tree.set(item, '선택', '☑' if target_state else '☐')
             
             # 마지막 클릭 위치 업데이트
             self.last_clicked_item = current_item
@@ -2215,26 +2757,20 @@ class GenreClassifierGUI:
             current_state = self.preview_checkboxes.get(current_item, True)
             new_state = not current_state
             self.preview_checkboxes[current_item] = new_state
-            values = list(self.preview_tree.item(current_item)['values'])
-            values[0] = '☑' if new_state else '☐'
-            self.preview_tree.item(current_item, values=values)
+            self.preview_tree.set(current_item, '선택', '☑' if new_state else '☐')
             self.last_clicked_item = current_item
     
     def select_all_preview(self):
         """미리보기 전체 선택"""
         for item in self.preview_tree.get_children():
             self.preview_checkboxes[item] = True
-            values = list(self.preview_tree.item(item)['values'])
-            values[0] = '☑'
-            self.preview_tree.item(item, values=values)
+            self.preview_tree.set(item, '선택', '☑')
     
     def deselect_all_preview(self):
         """미리보기 전체 해제"""
         for item in self.preview_tree.get_children():
             self.preview_checkboxes[item] = False
-            values = list(self.preview_tree.item(item)['values'])
-            values[0] = '☐'
-            self.preview_tree.item(item, values=values)
+            self.preview_tree.set(item, '선택', '☐')
     
     def execute_rename(self):
         """파일명 변경 실행 (선택된 파일만)"""
@@ -2263,7 +2799,7 @@ class GenreClassifierGUI:
         backup_dir = os.path.join(self.current_directory, "backup")
         os.makedirs(backup_dir, exist_ok=True)
         
-        format_type = self.rename_format_var.get()
+        format_name = _rename_formatter(self.rename_format_var.get())
         success_count = 0
         renamed_items = []  # 성공적으로 변경된 항목 추적
         
@@ -2295,32 +2831,11 @@ class GenreClassifierGUI:
                 backup_path = os.path.join(backup_dir, os.path.basename(result['filename']))
                 shutil.copy2(original_path, backup_path)
                 
-                # 새 파일명 생성
-                basename = os.path.basename(result['filename'])
-                genre = result['genre']
-                
-                # 사용자가 파일명을 직접 수정했으면 그것을 사용
+                # 새 파일명 생성 (사용자가 파일명을 직접 수정했으면 그것을 사용, 이미 확장자 포함)
                 if result.get('filename_edited') and result.get('custom_filename'):
-                    # 사용자가 수정한 파일명 (이미 확장자 포함)
-                    custom_basename = result['custom_filename']
-                    name, ext = os.path.splitext(custom_basename)
-                    
-                    # 장르 추가 형식 적용
-                    if format_type == "[장르] 제목":
-                        new_name = f"[{genre}] {name}{ext}"
-                    elif format_type == "제목 [장르]":
-                        new_name = f"{name} [{genre}]{ext}"
-                    else:  # "장르_제목"
-                        new_name = f"{genre}_{name}{ext}"
+                    new_name = format_name(result['custom_filename'], result['genre'])
                 else:
-                    # 기존 로직 (원본 파일명 사용)
-                    if format_type == "[장르] 제목":
-                        new_name = f"[{genre}] {basename}"
-                    elif format_type == "제목 [장르]":
-                        name, ext = os.path.splitext(basename)
-                        new_name = f"{name} [{genre}]{ext}"
-                    else:  # "장르_제목"
-                        new_name = f"{genre}_{basename}"
+                    new_name = format_name(os.path.basename(result['filename']), result['genre'])
                 
                 new_path = os.path.join(self.current_directory, new_name)
                 
@@ -2333,10 +2848,10 @@ class GenreClassifierGUI:
                 print(f"오류: {result['filename']} - {str(e)}")
         
         # 성공적으로 변경된 항목들을 미리보기에서 제거
+        if renamed_items:
+            self.preview_tree.delete(*renamed_items)
         for item in renamed_items:
-            self.preview_tree.delete(item)
-            if item in self.preview_checkboxes:
-                del self.preview_checkboxes[item]
+            self.preview_checkboxes.pop(item, None)
         
         # 분류 결과 데이터에서도 변경된 파일들 제거
         if success_count > 0:
@@ -2355,10 +2870,8 @@ class GenreClassifierGUI:
         # 현재 디렉토리의 파일 목록 확인
         try:
             current_files = set()
-            if self.current_directory and os.path.exists(self.current_directory):
-                for file in os.listdir(self.current_directory):
-                    if os.path.isfile(os.path.join(self.current_directory, file)):
-                        current_files.add(file)
+            if self.current_directory and os.path.isdir(self.current_directory):
+                current_files.update(self._scan_directory(self.current_directory))
             
             # 분류 결과에서 존재하지 않는 파일들 제거
             remaining_results = []
@@ -2372,12 +2885,14 @@ class GenreClassifierGUI:
                 else:
                     # 파일이 없으면 제거 (파일명이 변경됨)
                     removed_count += 1
+                    self._count_result(result, -1)
             
             # 결과 업데이트
             self.results = remaining_results
+            self._results_version += 1
             
-            # 분류 결과 트리뷰에서도 제거
-            self._update_result_tree_after_rename()
+            # 분류 결과 트리뷰에서도 제거 (방금 확인한 파일 목록 재사용)
+            self._update_result_tree_after_rename(current_files)
             
             # 통계 업데이트
             self.update_statistics()
@@ -2387,30 +2902,31 @@ class GenreClassifierGUI:
         except Exception as e:
             print(f"분류 결과 정리 중 오류: {str(e)}")
     
-    def _update_result_tree_after_rename(self):
-        """파일명 변경 후 분류 결과 트리뷰 업데이트"""
+    def _update_result_tree_after_rename(self, current_files=None):
+        """
+        파일명 변경 후 분류 결과 트리뷰 업데이트
+        
+        Args:
+            current_files: 현재 디렉토리의 파일 이름 집합 (None이면 새로 확인)
+        """
         if not hasattr(self, 'tree'):
             return
         
         # 현재 디렉토리의 파일 목록
-        current_files = set()
-        if self.current_directory and os.path.exists(self.current_directory):
-            for file in os.listdir(self.current_directory):
-                if os.path.isfile(os.path.join(self.current_directory, file)):
-                    current_files.add(file)
-        
-        # 트리뷰에서 존재하지 않는 파일들 제거
-        items_to_remove = []
-        for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            if values and len(values) > 0:
-                filename = values[0]  # 첫 번째 컬럼이 파일명
-                if filename not in current_files:
-                    items_to_remove.append(item)
-        
-        # 항목 제거
-        for item in items_to_remove:
-            self.tree.delete(item)
+        if current_files is None:
+            current_files = set()
+            if self.current_directory and os.path.isdir(self.current_directory):
+                current_files.update(self._scan_directory(self.current_directory))
+        
+        # 트리뷰에서 존재하지 않는 파일들 제거 (행 값은 _row_values 캐시에서 읽음)
+        row_values = self._row_values
+        items_to_remove = [
+            item for item in self.tree.get_children()
+            if row_values[item][0] not in current_files  # 첫 번째 컬럼이 파일명
+        ]
+        
+        # 항목 제거 (한 번의 호출로 삭제)
+        self._delete_rows(items_to_remove)
     
     def restore_filenames(self):
         """파일명 복구"""
@@ -13,7 +13,7 @@ from core.adapters.genre_classifier_adapter import GenreClassifierAdapter
 from core.pipeline_orchestrator import PipelineConfig
 from core.novel_task import NovelTask
 from core.title_anchor_extractor import TitleAnchorExtractor
-from dotenv import load_dotenv
+from core.utils.env import ensure_env_loaded
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -25,7 +25,7 @@ def main():
     print("="*80)
 
     # 1. 환경 변수 로드 (Override)
-    load_dotenv(override=True)
+    ensure_env_loaded()
     
     # 2. API 설정 및 키 접두사 검증
     manager = APIConfigManager()
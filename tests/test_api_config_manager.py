@@ -0,0 +1,104 @@
+"""
+APIConfigManager 암호화 저장/로드 테스트
+
+(기존 api_config_manager.py의 test_encryption()을 테스트 모듈로 이동)
+"""
+import os
+import sys
+import json
+import base64
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.utils.env import ensure_env_loaded
+from modules.classifier import api_config_manager
+from modules.classifier.api_config_manager import APIConfigManager
+
+TEST_ID = "test_client_id_12345"
+TEST_SECRET = "test_client_secret_67890"
+
+
+class TestAPIConfigEncryption(unittest.TestCase):
+    def setUp(self):
+        # .env 로드는 프로세스당 1회이므로 먼저 수행한 뒤 테스트용 환경변수 제거
+        ensure_env_loaded()
+        self._saved_env = {
+            key: os.environ.pop(key)
+            for key in ('NAVER_CLIENT_ID', 'NAVER_CLIENT_SECRET')
+            if key in os.environ
+        }
+
+        # 실제 키/설정 파일을 건드리지 않도록 임시 폴더 사용
+        self.temp_dir = tempfile.mkdtemp()
+        self._dir_patch = patch.object(api_config_manager, '_APP_DIR', self.temp_dir)
+        self._dir_patch.start()
+        api_config_manager._KEY_CACHE.clear()
+
+        self.manager = APIConfigManager('test_config.json')
+        self.config_path = os.path.join(self.temp_dir, 'test_config.json')
+
+    def tearDown(self):
+        self._dir_patch.stop()
+        api_config_manager._KEY_CACHE.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        os.environ.update(self._saved_env)
+
+    def test_encrypted_round_trip(self):
+        self.assertTrue(self.manager.save_config(TEST_ID, TEST_SECRET, encrypt=True))
+
+        config = self.manager.load_config()
+        self.assertEqual(config, {'client_id': TEST_ID, 'client_secret': TEST_SECRET})
+
+        # 파일에는 평문이 남지 않아야 함
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.assertNotIn(TEST_SECRET, content)
+        self.assertTrue(json.loads(content)['encrypted'])
+
+    def test_plain_round_trip(self):
+        self.assertTrue(self.manager.save_config(TEST_ID, TEST_SECRET, encrypt=False))
+
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['client_secret'], TEST_SECRET)
+
+        config = self.manager.load_config()
+        self.assertEqual(config, {'client_id': TEST_ID, 'client_secret': TEST_SECRET})
+
+    def test_legacy_fernet_config_still_loads(self):
+        from cryptography.fernet import Fernet
+
+        # 이전 버전 형식: Fernet 토큰만 저장 (nonce 없음)
+        token = Fernet(self.manager.cipher_key).encrypt(
+            json.dumps({'client_id': TEST_ID, 'client_secret': TEST_SECRET}).encode()
+        )
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'encrypted': True, 'data': base64.b64encode(token).decode()}, f)
+
+        config = self.manager.load_config()
+        self.assertEqual(config, {'client_id': TEST_ID, 'client_secret': TEST_SECRET})
+
+    def test_env_config_skips_key_creation(self):
+        with patch.dict(os.environ, {'NAVER_CLIENT_ID': TEST_ID, 'NAVER_CLIENT_SECRET': TEST_SECRET}):
+            config = self.manager.load_config()
+
+        self.assertEqual(config, {'client_id': TEST_ID, 'client_secret': TEST_SECRET})
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, '.api_key')))
+
+    def test_save_invalidates_cached_config(self):
+        self.manager.save_config(TEST_ID, TEST_SECRET, encrypt=True)
+        self.manager.load_config()
+
+        self.manager.save_config('new_id', 'new_secret', encrypt=True)
+        config = self.manager.load_config()
+        self.assertEqual(config['client_id'], 'new_id')
+        self.assertEqual(config['client_secret'], 'new_secret')
+
+
+if __name__ == '__main__':
+    unittest.main()
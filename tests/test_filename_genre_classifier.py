@@ -0,0 +1,65 @@
+"""
+FilenameGenreClassifier 제목 추출 테스트
+
+(기존 filename_genre_classifier.py의 test_title_extraction()을 테스트 모듈로 이동)
+"""
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.classifier.filename_genre_classifier import FilenameGenreClassifier
+
+TITLE_CASES = [
+    ("나 혼자 소드 마스터 1-1031 (완) + 외전 1-79, 에필.txt", "나 혼자 소드 마스터"),
+    ("눈 감고 3점 슛 1-424 (완).txt", "눈 감고 3점 슛"),
+    ("화산귀환 1-50화.txt", "화산귀환"),
+    ("[판타지] 전지적 독자 시점 1-551 (완).epub", "전지적 독자 시점"),
+    ("금리낭자 1-141 (완).txt", "금리낭자"),
+    ("나혼자만레벨업_001.txt", "나혼자만레벨업"),
+]
+
+
+class TestTitleExtraction(unittest.TestCase):
+    def setUp(self):
+        # 제목 추출만 검증하므로 HybridClassifier(네트워크/드라이버) 초기화는 생략
+        with patch('modules.classifier.filename_genre_classifier.HybridClassifier'):
+            self.classifier = FilenameGenreClassifier()
+
+    def test_extract_title_from_filename(self):
+        for filename, expected in TITLE_CASES:
+            with self.subTest(filename=filename):
+                self.assertEqual(self.classifier.extract_title_from_filename(filename), expected)
+
+    def test_classify_files_deduplicates_titles(self):
+        self.classifier.classifier.classify.side_effect = lambda title, **kwargs: {
+            'genre': '판타지', 'confidence': 0.9, 'method': 'mock', 'title': title
+        }
+        filenames = ["화산귀환 1-50화.txt", "화산귀환 51-100화.txt", "금리낭자 1-141 (완).txt", "_001.txt"]
+
+        results = self.classifier.classify_files(filenames, max_workers=4)
+
+        self.assertEqual([r['filename'] for r in results], filenames)
+        self.assertEqual([r['title'] for r in results], ["화산귀환", "화산귀환", "금리낭자", None])
+        self.assertEqual(results[3]['method'], 'no_title')
+        classified_titles = sorted(call.args[0] for call in self.classifier.classifier.classify.call_args_list)
+        self.assertEqual(classified_titles, ["금리낭자", "화산귀환"])
+
+    def test_classify_files_is_serial_without_api(self):
+        caller = threading.get_ident()
+        self.classifier.classifier.classify.side_effect = lambda title, **kwargs: {
+            'genre': '판타지', 'confidence': 0.9, 'method': 'mock', 'thread': threading.get_ident()
+        }
+        filenames = ["화산귀환 1-50화.txt", "금리낭자 1-141 (완).txt"]
+
+        results = self.classifier.classify_files(filenames)
+
+        self.assertEqual([r['details']['thread'] for r in results], [caller, caller])
+
+
+if __name__ == '__main__':
+    unittest.main()
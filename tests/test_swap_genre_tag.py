@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui.main_window import swap_genre_tag
+
+
+def test_swap_leading_tag():
+    assert swap_genre_tag("[판타지] 전지적 독자 시점 1-551 (완)", "판타지", "현판") == "[현판] 전지적 독자 시점 1-551 (완)"
+
+
+def test_swap_keeps_genre_inside_title():
+    assert swap_genre_tag("[무협] [무협]지존 1-100", "무협", "판타지") == "[판타지] [무협]지존 1-100"
+
+
+def test_tag_only_name_has_no_trailing_space():
+    assert swap_genre_tag("[판타지]", "판타지", "현판") == "[현판]"
+    assert swap_genre_tag("[판타지] ", "판타지", "") == ""
+
+
+def test_remove_tag():
+    assert swap_genre_tag("[판타지] 제목", "판타지", "") == "제목"
+
+
+def test_no_previous_tag():
+    assert swap_genre_tag("제목 1-100 ", "", "로판") == "[로판] 제목 1-100"
+    assert swap_genre_tag(" 제목", "", "") == "제목"
+
+
+def test_tag_not_at_start():
+    assert swap_genre_tag("제목 [판타지]", "판타지", "현판") == "제목 [현판]"